@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-candidate Planner / Engineer / Refiner (v0.2)
+
+Purpose:
+  With --candidates N (or RYS_CANDIDATES) the role asks for N answers at
+  the cost of one prompt-processing pass and prints only the best one
+  (candidate_score.py), so the triple-check chain continues with a single
+  answer as before.
+
+  OpenAI-compatible backends get one request with `n` (RYS_CANDIDATE_N=0
+  skips it); the choices come back together in one non-streaming response.
+  Streaming would not print anything sooner (scoring needs every complete
+  answer), and the backends' stream parsers follow choice 0 only. Missing
+  choices (servers that ignore or reject `n`, the native Ollama backend)
+  are requested in parallel with distinct seeds. When nothing was
+  generated yet, they start once the first request streams its first
+  token, i.e. once the server holds the shared prompt in its prefix cache.
+
+  The selection is reported on stderr and as a 'candidates' metric.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Documented why the `n` request does not stream
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from candidate_score import pick_winner, score_candidates
+from chat_api import stream_chat_completion
+from chat_metrics import record_metric
+from chat_oneshot import complete_chat
+from chat_session import build_chat_config
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from role_utils import load_risk_patterns
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RISKS_FILE = os.path.join(os.path.dirname(SCRIPT_DIR), "config", "risks.json")
+CANDIDATE_ROLES = ("planner", "engineer", "refiner")
+
+
+def candidate_count(requested: int) -> int:
+    """Candidates per call; 0 or 1 disables candidate mode."""
+    return requested or int(os.environ.get("RYS_CANDIDATES", "0") or 0)
+
+
+def _n_choices(config: ChatConfig, messages: List[Dict[str, str]], count: int) -> List[str]:
+    """All choices of one request with `n`; [] when the server rejected it."""
+    colors = TerminalColors(enable_color=False)
+    result = complete_chat(config, messages, colors, {"n": count})
+    return [(c.get("message") or {}).get("content") or "" for c in result["choices"]]
+
+
+def _parallel(
+    config: ChatConfig, messages: List[Dict[str, str]], seeds: range
+) -> List[str]:
+    """One streamed request per seed; seed 0 is sent as is and leads the others."""
+    colors = TerminalColors(enable_color=False)
+    prefix_ready = threading.Event()
+    if seeds.start > 0:
+        prefix_ready.set()
+
+    def ask(seed: int) -> str:
+        parts = []
+        extra = {"seed": seed} if seed else None
+        if seed:
+            prefix_ready.wait()
+        try:
+            for chunk in stream_chat_completion(config, messages, colors, extra):
+                prefix_ready.set()
+                parts.append(chunk)
+        finally:
+            prefix_ready.set()
+        return "".join(parts)
+
+    with ThreadPoolExecutor(max_workers=max(len(seeds), 1)) as pool:
+        answers = list(pool.map(ask, seeds))
+    return answers
+
+
+def generate_candidates(
+    config: ChatConfig, messages: List[Dict[str, str]], count: int
+) -> Tuple[List[str], str]:
+    """Returns (answers, strategy); strategy is 'n', 'parallel' or 'n+parallel'."""
+    answers: List[str] = []
+    strategy = "parallel"
+    if config.backend == "openai" and os.environ.get("RYS_CANDIDATE_N", "1") != "0":
+        answers = _n_choices(config, messages, count)[:count]
+        strategy = "n" if answers else strategy
+    if len(answers) < count:
+        answers += _parallel(config, messages, range(len(answers), count))
+        strategy = "n+parallel" if strategy == "n" else strategy
+    return answers, strategy
+
+
+def run_candidate_role(args: argparse.Namespace, count: int) -> None:
+    """Generates `count` answers for args.prompt and prints the best one."""
+    config = build_chat_config(args)
+    messages = [
+        {"role": "system", "content": args.system},
+        {"role": "user", "content": args.prompt},
+    ]
+    started = time.monotonic()
+    answers, strategy = generate_candidates(config, messages, count)
+    scores = score_candidates(args.role, answers, load_risk_patterns(RISKS_FILE))
+    winner = pick_winner(scores)
+    elapsed = time.monotonic() - started
+    if winner < 0:
+        raise RuntimeError(f"all {count} candidates failed: {answers[0].strip()}")
+
+    best = scores[winner]
+    sys.stderr.write(
+        f"[candidates] {args.role}: {len(answers)} via {strategy} in {elapsed:.1f}s, "
+        f"picked #{winner + 1} (format {best['format']:.2f}, risks {best['risks']}, "
+        f"agreement {best['agreement']:.2f})\n"
+    )
+    record_metric(
+        "candidates", role=args.role, requested=count, strategy=strategy, winner=winner,
+        duration_ms=round(elapsed * 1000, 1), scores=scores
+    )
+    print(answers[winner].strip())
+    return None
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Candidate Plan Scoring (v0.2)
+
+Purpose:
+  Local selection among several answers of the planner, engineer or
+  refiner. Each candidate is scored on
+    format     share of answer lines that are steps in the role's output
+               format (0 with a code block; planner outside 3-7 steps halved)
+    risks      risk pattern hits (config/risks.json), -1 each
+    agreement  mean word overlap (Jaccard) with the other candidates
+  and the highest total wins; ties go to the earlier candidate. Failed
+  answers ([Error] / [Connection Error]) are never selected.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Risk patterns come from role_utils.py (shared with exec_plan.py)
+"""
+# pylint: disable=useless-return
+
+import re
+from typing import Any, Dict, List, Pattern, Set, Tuple
+
+from role_utils import matched_risks
+
+STEP_RE = {
+    "planner": re.compile(r"^\s*\d+\.\s+\S"),
+    "refiner": re.compile(r"^\s*\d+\.\s+\S"),
+    "engineer": re.compile(r"^\s*-\s+\S"),
+}
+WORD_RE = re.compile(r"[a-z0-9_]+")
+
+
+def format_score(role: str, text: str) -> float:
+    """0..1: how well the answer follows the role's step format."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    step_re = STEP_RE.get(role, STEP_RE["planner"])
+    steps = sum(1 for line in lines if step_re.match(line))
+    score = steps / len(lines) if lines and "```" not in text else 0.0
+    if role == "planner" and not 3 <= steps <= 7:
+        score /= 2
+    return score
+
+
+def _words(text: str) -> Set[str]:
+    return set(WORD_RE.findall(text.lower()))
+
+
+def agreement_scores(texts: List[str]) -> List[float]:
+    """Mean Jaccard similarity of each text with every other one."""
+    words = [_words(t) for t in texts]
+    scores = []
+    for i, mine in enumerate(words):
+        others = [
+            len(mine & theirs) / len(mine | theirs) if mine | theirs else 1.0
+            for j, theirs in enumerate(words) if j != i
+        ]
+        scores.append(sum(others) / len(others) if others else 0.0)
+    return scores
+
+
+def is_failed(text: str) -> bool:
+    """Errors are returned as content by the chat clients."""
+    return "[Connection Error]" in text or "[Error]" in text or not text.strip()
+
+
+def score_candidates(
+    role: str, texts: List[str], patterns: List[Tuple[str, Pattern[str]]]
+) -> List[Dict[str, Any]]:
+    """One score entry per candidate, in candidate order."""
+    usable = [t for t in texts if not is_failed(t)]
+    agreement = iter(agreement_scores(usable))
+    scores = []
+    for index, text in enumerate(texts):
+        entry: Dict[str, Any] = {"index": index, "failed": is_failed(text)}
+        if not entry["failed"]:
+            entry.update(
+                format=round(format_score(role, text), 3),
+                risks=len(matched_risks(text, patterns)), agreement=round(next(agreement), 3)
+            )
+            entry["total"] = round(entry["format"] + entry["agreement"] - entry["risks"], 3)
+        scores.append(entry)
+    return scores
+
+
+def pick_winner(scores: List[Dict[str, Any]]) -> int:
+    """Index of the best usable candidate, -1 if every candidate failed."""
+    usable = [s for s in scores if not s["failed"]]
+    winner = -1
+    if usable:
+        winner = max(usable, key=lambda s: (s["total"], -s["index"]))["index"]
+    return winner
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adaptive In-flight Limit per Endpoint (v0.4)
+
+Purpose:
+  With RYS_SCHED_LIMIT=auto the scheduler's in-flight limit is learned per
+  endpoint from each completion's TTFT (per 1k prompt chars) and decode
+  rate (tokens/s) against slowly drifting best-seen baselines. A sample
+  worse than baseline * RYS_SCHED_TOLERANCE (+ TTFT slack) shrinks the
+  limit by that ratio (at most by half); errors and overload replies halve
+  it; a healthy sample that had to queue (no slot free at its first
+  attempt) adds 1/limit (AIMD); an uncontended one holds. The limit
+  stays within RYS_SCHED_MIN..RYS_SCHED_MAX and is shared by all processes
+  via a state file beside the slot files. Decisions are 'aimd' metrics;
+  the samples come from chat_meter.CompletionMeter.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Ollama token counts
+  3. 2026-10-19 CompletionMeter moved to chat_meter.py
+  4. 2026-10-19 Only requests that really queued count toward an increase
+"""
+# pylint: disable=useless-return
+
+import os
+import json
+import time
+import contextlib
+from typing import Any, Dict
+
+from chat_metrics import record_metric
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # pylint: disable=invalid-name
+
+BASELINE_DRIFT = 1.02
+TTFT_SLACK_S = 0.05
+
+
+def adaptive_enabled() -> bool:
+    """True when RYS_SCHED_LIMIT=auto."""
+    return os.environ.get("RYS_SCHED_LIMIT", "").strip().lower() == "auto"
+
+
+def _bounds() -> Dict[str, float]:
+    return {
+        "min": float(os.environ.get("RYS_SCHED_MIN", "1")),
+        "max": float(os.environ.get("RYS_SCHED_MAX", "8")),
+        "tolerance": float(os.environ.get("RYS_SCHED_TOLERANCE", "2.0")),
+    }
+
+
+def _load(path: str) -> Dict[str, Any]:
+    state: Dict[str, Any] = {}
+    with contextlib.suppress(OSError, ValueError):
+        with open(path, 'r', encoding='utf-8') as f_in:
+            state = json.load(f_in)
+    return state
+
+
+def current_limit(state_dir: str, key: str) -> int:
+    """The endpoint's current in-flight limit."""
+    bounds = _bounds()
+    limit = _load(os.path.join(state_dir, f"{key}.aimd.json")).get("limit", min(2.0, bounds["max"]))
+    return int(max(bounds["min"], min(bounds["max"], limit)))
+
+
+def _decide(state: Dict[str, Any], sample: Dict[str, Any]) -> str:
+    """Updates baselines and the limit in `state`; returns the decision."""
+    bounds = _bounds()
+    limit = state.get("limit", min(2.0, bounds["max"]))
+    gradient = 1.0
+    if sample.get("ttft_s") is not None:
+        ttft = sample["ttft_s"] / max(sample.get("prompt_chars", 0) / 1000, 1.0)
+        base = min(state.get("ttft_base", ttft) * BASELINE_DRIFT, ttft)
+        state["ttft_base"] = base
+        gradient = min(gradient, (base * bounds["tolerance"] + TTFT_SLACK_S) / max(ttft, 1e-6))
+    if sample.get("rate"):
+        rate_base = max(state.get("rate_base", sample["rate"]) / BASELINE_DRIFT, sample["rate"])
+        state["rate_base"] = rate_base
+        gradient = min(gradient, sample["rate"] * bounds["tolerance"] / rate_base)
+
+    decision = "hold"
+    if not sample.get("ok", True):
+        limit, decision = limit * 0.5, "backoff"
+    elif gradient < 1.0:
+        limit, decision = limit * max(gradient, 0.5), "decrease"
+    elif sample.get("wait_s", 0.0) > 0.0:  # 0.0 unless a slot was not free at once
+        limit, decision = limit + 1.0 / max(limit, 1.0), "increase"
+    state["limit"] = max(bounds["min"], min(bounds["max"], limit))
+    return decision
+
+
+def observe(state_dir: str, key: str, endpoint: str, sample: Dict[str, Any]) -> None:
+    """Feeds one completion's measurements into the endpoint's controller."""
+    path = os.path.join(state_dir, f"{key}.aimd.json")
+    fd = os.open(os.path.join(state_dir, f"{key}.aimd.lock"), os.O_RDWR | os.O_CREAT)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        state = _load(path)
+        before = state.get("limit", min(2.0, _bounds()["max"]))
+        decision = _decide(state, sample)
+        state["updated"] = round(time.time(), 3)
+        with open(f"{path}.{os.getpid()}", 'w', encoding='utf-8') as f_out:
+            json.dump(state, f_out)
+        os.replace(f"{path}.{os.getpid()}", path)
+    finally:
+        os.close(fd)
+    record_metric(
+        "aimd", endpoint=endpoint, decision=decision, limit_before=round(before, 2),
+        limit=round(state["limit"], 2), ok=sample.get("ok", True),
+        ttft_ms=round(sample["ttft_s"] * 1000, 1) if sample.get("ttft_s") is not None else None,
+        rate=round(sample.get("rate") or 0.0, 1), wait_ms=round(sample.get("wait_s", 0.0) * 1000, 1)
+    )
+    return None
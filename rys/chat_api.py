@@ -1,30 +1,31 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-API Communication and Data Loading (v0.1)
+API Communication and Data Loading (v0.6)
 
 History:
   1. 2026-02-07 Initial version (split from chat_core.py)
+  2. 2026-10-19 Completions wait for a scheduler slot (chat_sched.py)
+  3. 2026-10-19 Extra payload fields (e.g. response_format)
+  4. 2026-10-19 Requests include_usage; usage is accounted per call
+  5. 2026-10-19 Requests are sent through chat_transport.open_completion
+  6. 2026-10-19 Call latency is accounted with the usage
+  7. 2026-10-19 Wire format comes from the configured backend (chat_backends.py)
 """
 # pylint: disable=useless-return,broad-exception-caught
 
 import sys
 import json
 import os
-import ssl
+import time
 import urllib.request
 import urllib.error
 from typing import Iterator, Dict, Any, List, Optional
+from chat_types import ChatConfig
 from chat_ui import TerminalColors
-
-def get_ssl_context(insecure: bool) -> Optional[ssl.SSLContext]:
-    """Returns an SSL context, possibly unverified."""
-    ctx = None
-    if insecure:
-        # pylint: disable=protected-access
-        ctx = ssl._create_unverified_context()
-    return ctx
-
+from chat_backends import get_backend
+from chat_transport import get_ssl_context, open_completion
+from token_usage import account_usage
 
 def build_base_url(host: str, port: Optional[str]) -> str:
     """Constructs the base URL from host and port."""
@@ -39,7 +40,7 @@ def build_base_url(host: str, port: Optional[str]) -> str:
         protocol = "http" if is_local else "https"
         host_part = host_input
 
-    default_port = "11434" if protocol == "http" else "443"
+    default_port = "11434" if protocol in ("http", "ollama") else "443"
 
     if ":" in host_part:
         final_host_part = host_part
@@ -50,9 +51,11 @@ def build_base_url(host: str, port: Optional[str]) -> str:
     return f"{protocol}://{final_host_part}"
 
 
-def verify_connection(base_url: str, timeout: int = 2, insecure: bool = False) -> None:
+def verify_connection(
+    base_url: str, timeout: int = 2, insecure: bool = False, path: str = "/v1/models"
+) -> None:
     """Checks if the API endpoint is reachable."""
-    target_url = f"{base_url}/v1/models"
+    target_url = f"{base_url}{path}"
     headers = {"Authorization": "Bearer not-needed"}
     ctx = get_ssl_context(insecure)
 
@@ -109,43 +112,30 @@ def load_session_data(
     return [normalize_message(m) for m in raw_data]
 
 
-def _parse_stream_line(line_str: str) -> Optional[str]:
-    """Parses a single line from the SSE stream."""
-    content = None
-    if line_str.startswith("data: "):
-        json_str = line_str[6:]
-        if json_str != "[DONE]":
-            try:
-                chunk = json.loads(json_str)
-                if "choices" in chunk and chunk["choices"]:
-                    content = chunk["choices"][0].get("delta", {}).get("content", "")
-            except (json.JSONDecodeError, KeyError):
-                pass
-    return content
-
-
 def stream_chat_completion(
-    url: str,
-    model: str,
+    config: ChatConfig,
     messages: List[Dict[str, str]],
     colors: TerminalColors,
-    insecure: bool = False
+    extra: Optional[Dict[str, Any]] = None
 ) -> Iterator[str]:
     """Generates streaming response from the API."""
-    headers = {"Content-Type": "application/json", "Authorization": "Bearer not-needed"}
-    payload = {"model": model, "messages": messages, "stream": True}
-    ctx = get_ssl_context(insecure)
+    backend = get_backend(config.backend)
+    payload = backend.payload(config.model, messages, True, extra or {})
+    usage: Dict[str, Any] = {}
+    received = []
+    started = time.monotonic()
 
     try:
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=data, headers=headers)
-        with urllib.request.urlopen(req, context=ctx) as response:
-            for line in response:
-                content = _parse_stream_line(line.decode("utf-8").strip())
+        with open_completion(config, payload) as chunks:
+            for line in chunks:
+                text = line.decode("utf-8").strip()
+                content = backend.parse_stream_line(text, usage)
                 if content:
+                    received.append(content)
                     yield content
-                elif line.decode("utf-8").strip() == "data: [DONE]":
+                elif backend.stream_done(text):
                     break
+        account_usage(config, messages, "".join(received), usage, time.monotonic() - started)
     except urllib.error.URLError as exc:
         yield f"\n{colors.wrap_error(f'[Connection Error] {exc}')}"
     except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chat Backend Adapters (v0.1)
+
+Purpose:
+  Wire formats behind stream_chat_completion / complete_chat: 'openai'
+  (/v1/chat/completions, SSE) and Ollama's native 'ollama' (/api/chat,
+  NDJSON) with RYS_OLLAMA_KEEP_ALIVE (default 30m) and RYS_OLLAMA_NUM_CTX
+  (keep it equal for all stages: another num_ctx reloads the model);
+  max_tokens becomes options.num_predict, a JSON Schema response_format
+  the native 'format'. Chosen by the host scheme (ollama://host:port,
+  ollama+https://) or RYS_LLM_BACKEND; the default is 'openai'.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return
+
+import os
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class OpenAIBackend:
+    """OpenAI-compatible chat completions (llama.cpp, vLLM, Ollama /v1)."""
+    name = "openai"
+    chat_path = "/v1/chat/completions"
+    models_path = "/v1/models"
+
+    def payload(
+        self, model: str, messages: List[Dict[str, str]], stream: bool, extra: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Request body; streams ask for a final usage chunk."""
+        body: Dict[str, Any] = {"model": model, "messages": messages, "stream": stream}
+        if stream:
+            body["stream_options"] = {"include_usage": True}
+        body.update(extra)
+        return body
+
+    def parse_stream_line(self, line: str, usage: Dict[str, Any]) -> Optional[str]:
+        """Content of one SSE line (usage chunks fill `usage`)."""
+        content = None
+        if line.startswith("data: ") and line[6:] != "[DONE]":
+            try:
+                chunk = json.loads(line[6:])
+                usage.update(chunk.get("usage") or {})
+                if chunk.get("choices"):
+                    content = chunk["choices"][0].get("delta", {}).get("content", "")
+            except (json.JSONDecodeError, KeyError):
+                pass
+        return content
+
+    def stream_done(self, line: str) -> bool:
+        """True for the end-of-stream marker."""
+        return line == "data: [DONE]"
+
+    def parse_response(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """{"content", "usage", "choices"} of a non-streaming response."""
+        choices = body.get("choices") or []
+        content = (choices[0].get("message") or {}).get("content") or "" if choices else ""
+        return {"content": content, "usage": body.get("usage") or {}, "choices": choices}
+
+    def model_ids(self, body: Dict[str, Any]) -> List[str]:
+        """Model names listed by models_path."""
+        return [str(m.get("id")) for m in body.get("data", [])]
+
+
+class OllamaBackend(OpenAIBackend):
+    """Ollama's native /api/chat with keep_alive, num_ctx and num_predict."""
+    name = "ollama"
+    chat_path = "/api/chat"
+    models_path = "/api/tags"
+    OPTION_KEYS = ("temperature", "top_p", "top_k", "seed", "stop")
+
+    def payload(
+        self, model: str, messages: List[Dict[str, str]], stream: bool, extra: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "model": model, "messages": messages, "stream": stream,
+            "keep_alive": os.environ.get("RYS_OLLAMA_KEEP_ALIVE", "30m"),
+        }
+        options = {k: v for k, v in extra.items() if k in self.OPTION_KEYS}
+        if os.environ.get("RYS_OLLAMA_NUM_CTX"):
+            options["num_ctx"] = int(os.environ["RYS_OLLAMA_NUM_CTX"])
+        if "max_tokens" in extra:
+            options["num_predict"] = extra["max_tokens"]
+        if options:
+            body["options"] = options
+        fmt = extra.get("response_format") or {}
+        if fmt.get("type") == "json_schema":
+            body["format"] = fmt["json_schema"]["schema"]
+        elif fmt.get("type") == "json_object":
+            body["format"] = "json"
+        return body
+
+    def _usage(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        """Ollama's final counters as OpenAI-style usage (plus model load time)."""
+        usage = {}
+        if chunk.get("done") and "eval_count" in chunk:
+            usage = {
+                "prompt_tokens": chunk.get("prompt_eval_count", 0),
+                "completion_tokens": chunk["eval_count"],
+                "load_ms": round(chunk.get("load_duration", 0) / 1e6, 1),
+            }
+        return usage
+
+    def parse_stream_line(self, line: str, usage: Dict[str, Any]) -> Optional[str]:
+        """Content of one NDJSON line; errors are raised."""
+        content = None
+        if line:
+            chunk = json.loads(line)
+            if "error" in chunk:
+                raise ValueError(f"Ollama: {chunk['error']}")
+            usage.update(self._usage(chunk))
+            content = (chunk.get("message") or {}).get("content", "")
+        return content
+
+    def stream_done(self, line: str) -> bool:
+        return bool(line) and bool(json.loads(line).get("done"))
+
+    def parse_response(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        message = body.get("message") or {}
+        choices = [{"index": 0, "message": message, "finish_reason": body.get("done_reason")}]
+        content = message.get("content") or ""
+        return {"content": content, "usage": self._usage(body), "choices": choices}
+
+    def model_ids(self, body: Dict[str, Any]) -> List[str]:
+        return [str(m.get("name")) for m in body.get("models", [])]
+
+
+BACKENDS = {"openai": OpenAIBackend(), "ollama": OllamaBackend()}
+
+
+def get_backend(name: str) -> OpenAIBackend:
+    """Backend by name; raises ValueError for unknown names."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name} (expected {', '.join(BACKENDS)})")
+    return BACKENDS[name]
+
+
+def resolve_backend(base_url: str) -> Tuple[str, str]:
+    """(backend name, plain http(s) base URL) for a build_base_url() result."""
+    scheme, _, rest = base_url.partition("://")
+    name = os.environ.get("RYS_LLM_BACKEND", "openai").strip().lower() or "openai"
+    if scheme.startswith("ollama"):
+        name = "ollama"
+        base_url = f"{'https' if scheme.endswith('+https') else 'http'}://{rest}"
+    get_backend(name)
+    return name, base_url
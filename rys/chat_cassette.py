@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Record/Replay Cassettes for Completions (v0.2)
+
+Purpose:
+  RYS_CASSETTE=<file> with RYS_CASSETTE_MODE=record appends every request
+  (URL, payload hash, messages) and its raw response chunks with relative
+  timestamps to a JSONL cassette. RYS_CASSETTE_MODE=replay serves them back
+  as fast as possible, replay-timed with the original timing, so a pipeline
+  can be re-run and profiled without a model.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Offsets count from when the request was sent, not from the headers
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import json
+import time
+import hashlib
+from typing import Any, Dict, Iterator, List
+
+_LOADED: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+_SERVED: Dict[str, int] = {}
+
+
+class CassetteMismatch(ValueError):
+    """Raised when a replayed request was never recorded."""
+
+
+def cassette_mode() -> str:
+    """Returns 'record', 'replay', 'replay-timed' or '' (disabled)."""
+    mode = os.environ.get("RYS_CASSETTE_MODE", "").strip().lower()
+    if not os.environ.get("RYS_CASSETTE"):
+        mode = ""
+    return mode
+
+
+def payload_hash(payload: Dict[str, Any]) -> str:
+    """Stable hash of the complete request payload."""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CassetteRecorder:
+    """Passes response chunks through while timing them; save() appends the entry."""
+
+    def __init__(
+        self, url: str, payload: Dict[str, Any], chunks: Iterator[bytes], started: float
+    ):
+        self.entry = {
+            "url": url, "hash": payload_hash(payload), "model": payload.get("model"),
+            "stream": bool(payload.get("stream")), "messages": payload.get("messages", []),
+            "chunks": [],
+        }
+        self.started = started  # time.monotonic() when the request was sent
+        self.chunks = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            offset = round(time.monotonic() - self.started, 4)
+            self.entry["chunks"].append([offset, chunk.decode("utf-8")])
+            yield chunk
+        return None
+
+    def save(self) -> None:
+        """Appends the interaction as one JSON line."""
+        with open(os.environ["RYS_CASSETTE"], 'a', encoding='utf-8') as f_out:
+            f_out.write(json.dumps(self.entry, ensure_ascii=False) + "\n")
+        return None
+
+
+def _load(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Indexes the cassette by payload hash (cached per process)."""
+    if path not in _LOADED:
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        with open(path, 'r', encoding='utf-8') as f_in:
+            for line in f_in:
+                if line.strip():
+                    entry = json.loads(line)
+                    index.setdefault(entry["hash"], []).append(entry)
+        _LOADED[path] = index
+    return _LOADED[path]
+
+
+def _describe_mismatch(url: str, payload: Dict[str, Any], index: Dict[str, List]) -> str:
+    """Explains where the request differs from the closest recorded one."""
+    wanted = payload.get("messages", [])
+    best, best_len = None, -1
+    for entries in index.values():
+        entry = entries[0]
+        same = 0
+        while same < min(len(wanted), len(entry["messages"])) and \
+                wanted[same] == entry["messages"][same]:
+            same += 1
+        if entry["url"] == url and same > best_len:
+            best, best_len = entry, same
+    detail = f"no recorded request for {url}"
+    if best is not None:
+        detail = f"closest recording matches {best_len}/{len(wanted)} messages"
+        if best_len < len(wanted):
+            got = str(wanted[best_len].get("content", ""))[:80]
+            detail += f"; first difference at message #{best_len}: {got!r}"
+        else:
+            detail += "; messages equal, other payload fields (model/options) differ"
+    return f"[Cassette Mismatch] {detail} (hash {payload_hash(payload)[:12]})"
+
+
+def replay_chunks(url: str, payload: Dict[str, Any], timed: bool) -> Iterator[bytes]:
+    """Yields the recorded chunks for this request, optionally with original timing."""
+    index = _load(os.environ["RYS_CASSETTE"])
+    key = payload_hash(payload)
+    if key not in index:
+        message = _describe_mismatch(url, payload, index)
+        sys.stderr.write(message + "\n")
+        raise CassetteMismatch(message)
+
+    # Identical requests are served in recorded order; the last one repeats.
+    served = _SERVED.get(key, 0)
+    _SERVED[key] = served + 1
+    entry = index[key][min(served, len(index[key]) - 1)]
+    started = time.monotonic()
+    for offset, text in entry["chunks"]:
+        if timed:
+            time.sleep(max(0.0, offset - (time.monotonic() - started)))
+        yield text.encode("utf-8")
+    return None
@@ -1,31 +1,43 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-OpenAI-compatible API Connection Command. (v0.3)
+OpenAI-compatible API Connection Command. (v0.8)
 
 History:
   1. 2025-12-29 Initial version
   2. 2026-02-07 Refactored and split into modules for Pylint compliance
   3. 2026-02-07 Further split to reduce file size < 6KiB
+  4. 2026-10-19 Requests carry a scheduler priority class
+  5. 2026-10-19 Session setup moved to chat_session.py for in-process callers
+  6. 2026-10-19 Quiet --no-stream turns use the non-streaming client
+  7. 2026-10-19 Optional prompt cache priming while the user types (--prime)
+  8. 2026-10-19 --model defaults to None so routes can tell an explicit model
 """
 # pylint: disable=useless-return,broad-exception-caught
 
 import sys
+import time
 import argparse
 from typing import Dict, List, Optional
 
 from chat_types import ChatConfig
 from chat_ui import TerminalColors, handle_interactive_output, handle_quiet_output
-from chat_api import verify_connection, load_session_data, stream_chat_completion, build_base_url
+from chat_api import stream_chat_completion
+from chat_oneshot import complete_chat
+from chat_prime import KVPrimer, first_chunk_timer, prime_enabled
+from chat_sched import PRIORITY_CLASSES
+from chat_session import build_chat_config, init_messages
 
 
 def process_turn(
     config: ChatConfig,
     messages: List[Dict[str, str]],
     colors: TerminalColors,
-    prompt_text: Optional[str] = None
+    prompt_text: Optional[str] = None,
+    primed: str = "off"
 ) -> None:
     """Orchestrates a single turn of conversation."""
+    started = time.monotonic()
     if prompt_text:
         messages.append({"role": "user", "content": prompt_text})
         if not config.quiet_mode:
@@ -36,9 +48,12 @@ def process_turn(
         sys.stdout.write(colors.colorize(status_msg, colors.sys_color))
         sys.stdout.flush()
 
-    stream_gen = stream_chat_completion(
-        config.api_url, config.model, messages, colors, insecure=config.insecure
-    )
+    if config.quiet_mode and not config.stream_output:
+        # Nobody watches tokens arrive: one JSON response instead of SSE chunks.
+        stream_gen = iter([complete_chat(config, messages, colors)["content"]])
+    else:
+        stream_gen = stream_chat_completion(config, messages, colors)
+    stream_gen = first_chunk_timer(stream_gen, started, role=config.role, primed=primed)
 
     if not config.quiet_mode:
         full_response = handle_interactive_output(stream_gen, colors, status_msg)
@@ -57,22 +72,26 @@ def process_turn(
 def _run_interactive_loop(
     config: ChatConfig,
     messages: List[Dict[str, str]],
-    colors: TerminalColors
+    colors: TerminalColors,
+    primer: Optional[KVPrimer] = None
 ) -> None:
     """Runs the main interactive REPL loop."""
     print(colors.colorize("Type 'exit' to stop.\n", colors.sys_color))
 
     while True:
         try:
+            if primer:
+                primer.start(messages)
             prompt_str = f"{colors.prompt_prefix}You > {colors.prompt_suffix}"
             user_input = input(prompt_str)
+            primed = primer.cancel() if primer else "off"
 
             if not user_input:
                 continue
             if user_input.lower() in ["exit", "quit"]:
                 break
 
-            process_turn(config, messages, colors, prompt_text=user_input)
+            process_turn(config, messages, colors, prompt_text=user_input, primed=primed)
 
         except (KeyboardInterrupt, EOFError):
             print("\nBye.")
@@ -87,29 +106,8 @@ def _run_interactive_loop(
 def run_chat_session(args: argparse.Namespace) -> None:
     """Initializes and runs the chat loop or one-shot command."""
     colors = TerminalColors(enable_color=not args.no_color)
-    base_url = build_base_url(args.host, args.port)
-    insecure_flag = getattr(args, "insecure", False)
-
-    verify_connection(base_url, insecure=insecure_flag)
-
-    config = ChatConfig(
-        api_url=f"{base_url.rstrip('/')}/v1/chat/completions",
-        model=args.model,
-        quiet_mode=args.quit,
-        stream_output=args.stream,
-        insecure=insecure_flag
-    )
-
-    messages = [{"role": "system", "content": args.system}]
-    loaded_session = load_session_data(args.session_file, args.session_json)
-    if loaded_session:
-        if loaded_session[0].get("role") == "system":
-            messages = loaded_session
-        else:
-            messages.extend(loaded_session)
-        if not args.quit:
-            msg = f"[Session Loaded] {len(loaded_session)} messages."
-            print(colors.colorize(msg, colors.sys_color))
+    config = build_chat_config(args)
+    messages = init_messages(args, colors)
 
     initial_prompt = args.prompt
     if initial_prompt is None and not sys.stdin.isatty():
@@ -123,7 +121,8 @@ def run_chat_session(args: argparse.Namespace) -> None:
         print(f"{colors.sys_color}{msg}{colors.reset_code}")
         if initial_prompt:
             process_turn(config, messages, colors, prompt_text=initial_prompt)
-        _run_interactive_loop(config, messages, colors)
+        primer = KVPrimer(config) if prime_enabled(args) else None
+        _run_interactive_loop(config, messages, colors, primer)
 
     return None
 
@@ -135,7 +134,7 @@ def main() -> None:
     )
     parser.add_argument("--host", default="localhost", help="Target Host IP")
     parser.add_argument("--port", "-p", help="Target Port")
-    parser.add_argument("--model", "-m", default="gemma3n:e4b", help="Model name")
+    parser.add_argument("--model", "-m", help="Model name (default: gemma3n:e4b)")
     parser.add_argument(
         "--system", "-s", default="You are a helpful assistant.",
         help="System prompt"
@@ -150,6 +149,8 @@ def main() -> None:
         "--insecure", "-k", action="store_true",
         help="Skip SSL certificate verification"
     )
+    parser.add_argument("--priority", choices=list(PRIORITY_CLASSES), help="Scheduler class")
+    parser.add_argument("--prime", action="store_true", help="Warm the prompt cache while typing")
 
     args = parser.parse_args()
     run_chat_session(args)
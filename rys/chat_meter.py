@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Completion Meter for the Adaptive Limit (v0.1)
+
+Purpose:
+  Times one completion's raw response chunks in chat_transport.py and
+  turns them into the sample chat_aimd.py learns from: ok, queue wait,
+  TTFT (streams only), decode rate (tokens/s, from the stream's content
+  chunks or the usage / Ollama eval_count of a non-streaming body) and
+  prompt size.
+
+History:
+  1. 2026-10-19 Initial version (split from chat_aimd.py)
+"""
+# pylint: disable=useless-return
+
+import json
+import time
+import contextlib
+from typing import Any, Dict, Iterator, Optional
+
+
+class CompletionMeter:
+    """Times one completion's response chunks for the controller."""
+
+    def __init__(self, payload: Dict[str, Any], wait_s: float):
+        self.stream = bool(payload.get("stream"))
+        messages = payload.get("messages", [])
+        self.sample: Dict[str, Any] = {
+            "ok": True, "wait_s": wait_s, "ttft_s": None, "rate": None,
+            "prompt_chars": sum(len(str(m.get("content", ""))) for m in messages),
+        }
+        self.started = time.monotonic()
+        self.first: Optional[float] = None
+        self.tokens = 0
+
+    def wrap(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Passes chunks through, counting tokens."""
+        for chunk in chunks:
+            if self.first is None:
+                self.first = time.monotonic()
+            if self.stream and b'"content"' in chunk:
+                self.tokens += 1
+            elif not self.stream:
+                with contextlib.suppress(ValueError, AttributeError):
+                    body = json.loads(chunk)
+                    usage = body.get("usage") or {"completion_tokens": body.get("eval_count", 0)}
+                    self.tokens = int(usage.get("completion_tokens", 0))
+            yield chunk
+        return None
+
+    def finish(self, ok: bool) -> Dict[str, Any]:
+        """The sample; TTFT only for streams."""
+        ended = time.monotonic()
+        self.sample["ok"] = ok
+        if self.stream and self.first is not None:
+            self.sample["ttft_s"] = self.first - self.started
+        decode_from = self.first if self.stream and self.first is not None else self.started
+        if self.tokens >= 4 and ended > decode_from:
+            self.sample["rate"] = self.tokens / (ended - decode_from)
+        return self.sample
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrics Recorder (v0.1)
+
+Purpose:
+  Appends one JSON object per event to the file named by RYS_METRICS_FILE.
+  Recording is a no-op when the variable is unset, so callers never need to
+  check whether metrics are enabled.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return
+
+import os
+import json
+import time
+from typing import Any
+
+
+def metrics_path() -> str:
+    """Returns the metrics file path, or an empty string when disabled."""
+    return os.environ.get("RYS_METRICS_FILE", "").strip()
+
+
+def record_metric(event: str, **fields: Any) -> None:
+    """Appends a single metrics event (best effort, never raises)."""
+    path = metrics_path()
+    if path:
+        record = {"ts": round(time.time(), 3), "pid": os.getpid(), "event": event}
+        record.update(fields)
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # A single write() of one line keeps concurrent appenders from interleaving.
+            with open(path, 'a', encoding='utf-8') as f_out:
+                f_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+    return None
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Non-streaming Completion Client (v0.4)
+
+Purpose:
+  Requests `"stream": false` with gzip transfer and decodes the whole body in
+  one pass. Used for pipeline stages where nobody watches tokens arrive, so
+  the per-chunk SSE parsing cost disappears. Errors are returned as content
+  in the same form as stream_chat_completion yields them.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Usage is accounted per call (token_usage.py)
+  3. 2026-10-19 Requests are sent through chat_transport.open_completion
+  4. 2026-10-19 Call latency is accounted with the usage
+  5. 2026-10-19 Wire format comes from the configured backend (chat_backends.py)
+"""
+# pylint: disable=useless-return
+
+import json
+import time
+import urllib.error
+from typing import Any, Dict, List, Optional
+
+from chat_backends import get_backend
+from chat_transport import open_completion
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from token_usage import account_usage
+
+
+def complete_chat(
+    config: ChatConfig,
+    messages: List[Dict[str, str]],
+    colors: TerminalColors,
+    extra: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Returns {"content": str, "usage": dict, "choices": list} from one response."""
+    backend = get_backend(config.backend)
+    payload = backend.payload(config.model, messages, False, extra or {})
+    result: Dict[str, Any] = {"content": "", "usage": {}, "choices": []}
+    started = time.monotonic()
+
+    try:
+        with open_completion(config, payload) as chunks:
+            body = json.loads(b"".join(chunks).decode("utf-8"))
+        result = backend.parse_response(body)
+        account_usage(
+            config, messages, result["content"], result["usage"], time.monotonic() - started
+        )
+    except urllib.error.URLError as exc:
+        result["content"] = f"\n{colors.wrap_error(f'[Connection Error] {exc}')}"
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        result["content"] = f"\n{colors.wrap_error(f'[Error] {exc}')}"
+
+    return result
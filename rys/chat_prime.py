@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Prompt Cache Priming for Interactive Sessions (v0.3)
+
+Purpose:
+  While the user is typing, the conversation so far is sent once with a
+  1-token budget so the server (llama.cpp, Ollama, vLLM prefix caching)
+  already holds its KV cache when the real turn arrives. Priming runs in a
+  daemon thread as a 'batch' class request and is cut off (socket shutdown)
+  as soon as a turn starts. Opt-in via --prime or RYS_PRIME=1.
+
+  Each turn records a 'ttft' metric tagged with the priming state
+  (off, warm, cancelled, error), so primed and cold turns can be compared
+  from RYS_METRICS_FILE.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Priming payload comes from the configured backend
+  3. 2026-10-19 No request goes out when cancel() lands while connecting
+"""
+# pylint: disable=useless-return
+
+import os
+import json
+import time
+import socket
+import argparse
+import threading
+import http.client
+from urllib.parse import urlsplit
+from typing import Any, Dict, Iterator, List, Optional
+
+from chat_backends import get_backend
+from chat_cassette import cassette_mode
+from chat_metrics import record_metric
+from chat_sched import scheduled_slot
+from chat_transport import get_ssl_context
+from chat_types import ChatConfig
+
+
+def prime_enabled(args: argparse.Namespace) -> bool:
+    """--prime or RYS_PRIME=1, and a live server (not a cassette replay)."""
+    wanted = getattr(args, "prime", False) or \
+        os.environ.get("RYS_PRIME", "").strip().lower() in ("1", "true", "yes")
+    return bool(wanted) and not cassette_mode().startswith("replay")
+
+
+def first_chunk_timer(chunks: Iterator[str], started: float, **fields: Any) -> Iterator[str]:
+    """Passes chunks through; records the time to the first one as a 'ttft' metric."""
+    pending = True
+    for chunk in chunks:
+        if pending:
+            record_metric("ttft", ttft_ms=round((time.monotonic() - started) * 1000, 1), **fields)
+            pending = False
+        yield chunk
+    return None
+
+
+class KVPrimer:
+    """Keeps at most one priming request in flight for a conversation."""
+
+    def __init__(self, config: ChatConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.cancelled = threading.Event()
+        self.conn: Optional[http.client.HTTPConnection] = None
+        self.worker: Optional[threading.Thread] = None
+        self.state = "off"
+        self.primed_len = 0
+
+    def start(self, messages: List[Dict[str, str]]) -> None:
+        """Primes the current prefix unless it was already primed."""
+        if len(messages) != self.primed_len:
+            self.cancel()
+            self.cancelled = threading.Event()
+            self.primed_len = len(messages)
+            self.state = "running"
+            payload = get_backend(self.config.backend).payload(
+                self.config.model, [dict(m) for m in messages], False, {"max_tokens": 1}
+            )
+            self.worker = threading.Thread(
+                target=self._run, args=(payload, self.cancelled), daemon=True
+            )
+            self.worker.start()
+        return None
+
+    def cancel(self) -> str:
+        """Cuts off an unfinished priming request; returns the priming state."""
+        if self.worker is not None and self.worker.is_alive():
+            self.cancelled.set()
+            self.state = "cancelled"
+            with self.lock:
+                conn = self.conn
+            if conn is not None and conn.sock is not None:
+                try:
+                    conn.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        return self.state
+
+    def _connect(self, cancelled: threading.Event) -> Optional[http.client.HTTPConnection]:
+        """Connects and publishes the connection for cancel(); None once cancelled.
+
+        The cancelled check and the publication share the lock, so cancel()
+        either sees the connected socket or the worker sees the flag.
+        """
+        parts = urlsplit(self.config.api_url)
+        conn = http.client.HTTPConnection(parts.hostname, parts.port)
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(
+                parts.hostname, parts.port, context=get_ssl_context(self.config.insecure)
+            )
+        conn.connect()
+        with self.lock:
+            if cancelled.is_set():
+                conn.close()
+                conn = None
+            self.conn = conn
+        return conn
+
+    def _run(self, payload: Dict[str, Any], cancelled: threading.Event) -> None:
+        """Worker: sends the priming request, ignoring its one-token answer."""
+        started = time.monotonic()
+        status = "warm"
+        try:
+            with scheduled_slot(self.config.api_url, "batch"):
+                conn = self._connect(cancelled)
+                if conn is not None:
+                    conn.request(
+                        "POST", urlsplit(self.config.api_url).path, body=json.dumps(payload),
+                        headers={"Content-Type": "application/json",
+                                 "Authorization": "Bearer not-needed"}
+                    )
+                    response = conn.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        status = "error"
+                    conn.close()
+        except (OSError, http.client.HTTPException):
+            status = "error"
+        if cancelled.is_set():
+            status = "cancelled"
+        else:
+            self.state = status
+        record_metric(
+            "prime", status=status, role=self.config.role, messages=len(payload["messages"]),
+            duration_ms=round((time.monotonic() - started) * 1000, 1)
+        )
+        return None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-role Model Routing (v0.3)
+
+Purpose:
+  Maps role names to a model and, optionally, another endpoint so cheap
+  stages (translater, titler) can run on a smaller model than the engineer
+  or refiner. Routes come from config/routing.json (or RYS_ROUTING_FILE,
+  ignored when a model was given explicitly; shipped without routes);
+  RYS_ROUTE_<ROLE>="model[@host:port]" overrides one role. A route whose
+  model the endpoint does not list (/v1/models or /api/tags), or whose endpoint is
+  unreachable, falls back to the default model and endpoint.
+
+  Every resolution records a 'route' metric; the model and endpoint also
+  appear on each call's 'usage' metric.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Models are listed through the endpoint's backend (/api/tags)
+  3. 2026-10-19 An explicit model skips the routing file; it ships without routes
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import json
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+from typing import Dict, List, Optional, Tuple
+
+from chat_api import build_base_url
+from chat_backends import get_backend, resolve_backend
+from chat_metrics import record_metric
+from chat_transport import get_ssl_context
+from chat_types import DEFAULT_MODEL
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROUTING_FILE = os.path.join(os.path.dirname(SCRIPT_DIR), "config", "routing.json")
+
+_MODELS: Dict[str, Optional[List[str]]] = {}
+
+
+def parse_route(spec: str) -> Dict[str, str]:
+    """'model', 'model@host', 'model@host:port' or 'model@http://host:port'."""
+    model, _, endpoint = spec.strip().partition("@")
+    route = {}
+    if model.strip():
+        route = {"model": model.strip(), "endpoint": endpoint.strip()}
+    return route
+
+
+def lookup_route(role: str, use_file: bool = True) -> Dict[str, str]:
+    """The role's route: the environment override first, then (if use_file) the routing file."""
+    override = os.environ.get(f"RYS_ROUTE_{role.upper()}")
+    route: Dict[str, str] = {}
+    if override is not None:
+        route = parse_route(override)
+    elif use_file:
+        path = os.environ.get("RYS_ROUTING_FILE", ROUTING_FILE)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f_in:
+                entry = json.load(f_in).get("roles", {}).get(role) or {}
+            route = parse_route(f"{entry.get('model', '')}@{entry.get('endpoint', '')}")
+    return route
+
+
+def list_models(base_url: str, insecure: bool = False) -> Optional[List[str]]:
+    """Model ids served at base_url (cached per process); None if unreachable."""
+    if base_url not in _MODELS:
+        models = None
+        name, http_base = resolve_backend(base_url)
+        backend = get_backend(name)
+        req = urllib.request.Request(
+            f"{http_base}{backend.models_path}", headers={"Authorization": "Bearer not-needed"}
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=2, context=get_ssl_context(insecure)) as resp:
+                models = backend.model_ids(json.loads(resp.read()))
+        except (urllib.error.URLError, OSError, ValueError, AttributeError):
+            models = None
+        _MODELS[base_url] = models
+    return _MODELS[base_url]
+
+
+def route_role(
+    role: str,
+    base_url: str,
+    model: Optional[str],
+    insecure: bool = False,
+    probe: bool = True
+) -> Tuple[str, str]:
+    """Returns (base_url, model) serving this role, falling back to the defaults.
+    Without an explicit model (None) the routing file applies and the default is DEFAULT_MODEL."""
+    route = lookup_route(role, use_file=model is None) if role else {}
+    model = model or DEFAULT_MODEL
+    target_url = base_url
+    if route.get("endpoint"):
+        target_url = build_base_url(route["endpoint"], None)
+    target_model = route.get("model") or model
+    status = "routed" if route else "default"
+
+    if probe and (target_url, target_model) != (base_url, model):
+        models = list_models(target_url, insecure)
+        if models is None or target_model not in models:
+            status = "unreachable" if models is None else "missing"
+            sys.stderr.write(
+                f"[route] {role}: {target_model} at {target_url} {status}, "
+                f"using {model} at {base_url}\n"
+            )
+            target_url, target_model = base_url, model
+
+    record_metric(
+        "route", role=role or "-", model=target_model, endpoint=urlsplit(target_url).netloc,
+        requested=route.get("model", ""), status=status
+    )
+    return target_url, target_model
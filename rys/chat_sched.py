@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Client-side Request Scheduler (v0.4)
+
+Purpose:
+  Bounds the number of in-flight completions per endpoint across every RYS
+  process on the host. Coordination uses a lock directory: each slot is a
+  file held with flock(), each waiter leaves a ticket file. Tickets are served
+  by priority class, then round-robin between processes, then arrival order
+  (chat_slots.py).
+
+  RYS_SCHED_LIMIT    in-flight limit per endpoint (0 or unset disables;
+                     'auto' adapts it to the backend, see chat_aimd.py)
+  RYS_SCHED_RESERVE  slots only 'interactive' may use (default 1 if limit > 1)
+  RYS_SCHED_DIR      lock directory (default <tmpdir>/rys-sched)
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Adaptive limit (RYS_SCHED_LIMIT=auto)
+  3. 2026-10-19 Ticket and slot files moved to chat_slots.py
+  4. 2026-10-19 The yielded wait is 0.0 unless the request actually queued
+"""
+# pylint: disable=useless-return
+
+import os
+import time
+import hashlib
+import tempfile
+import threading
+import contextlib
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from chat_aimd import adaptive_enabled, current_limit, observe
+from chat_metrics import record_metric
+from chat_slots import HAS_FCNTL, allowed_slots, ticket_queue, try_slots
+
+PRIORITY_CLASSES = {"interactive": 0, "pipeline": 1, "batch": 2}
+POLL_INTERVAL = 0.02
+
+
+def resolve_priority(requested: Optional[str], quiet_mode: bool) -> str:
+    """Explicit choice > RYS_PRIORITY > interactive for REPLs, pipeline otherwise."""
+    fallback = "pipeline" if quiet_mode else "interactive"
+    priority = requested or os.environ.get("RYS_PRIORITY") or fallback
+    if priority not in PRIORITY_CLASSES:
+        raise ValueError(f"Unknown priority class: {priority}")
+    return priority
+
+
+def sched_limit(lock_dir: str = "", key: str = "") -> int:
+    """Returns the in-flight limit (0 = scheduler disabled)."""
+    if adaptive_enabled():
+        limit = current_limit(lock_dir, key) if lock_dir else 1
+    else:
+        limit = int(os.environ.get("RYS_SCHED_LIMIT", "0") or 0)
+    return limit
+
+
+def _sched_dir() -> str:
+    """Returns (and creates) the lock directory."""
+    path = os.environ.get("RYS_SCHED_DIR") or os.path.join(tempfile.gettempdir(), "rys-sched")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _endpoint_key(url: str) -> str:
+    """Stable short key for the endpoint (scheme + host + port)."""
+    parts = urlsplit(url)
+    return hashlib.sha1(f"{parts.scheme}://{parts.netloc}".encode()).hexdigest()[:12]
+
+
+@contextlib.contextmanager
+def scheduled_slot(url: str, priority: str = "pipeline") -> Iterator[float]:
+    """Blocks until an in-flight slot is free; yields the queue wait in seconds.
+
+    The wait is 0.0 when a slot was granted at the first attempt, so the
+    bookkeeping time (ticket file, directory listing) never counts as queueing.
+    """
+    limit = sched_limit()
+    fd = None
+    ticket = ""
+    wait = 0.0
+    queued = False
+
+    if limit > 0 and HAS_FCNTL:
+        lock_dir = _sched_dir()
+        key = _endpoint_key(url)
+        prio = PRIORITY_CLASSES.get(priority, PRIORITY_CLASSES["pipeline"])
+        ticket = os.path.join(
+            lock_dir, f"{key}.wait.{prio}.{time.time_ns()}.{os.getpid()}.{threading.get_ident()}"
+        )
+        started = time.monotonic()
+        with open(ticket, 'w', encoding='utf-8'):
+            pass
+        try:
+            while fd is None:
+                queue = ticket_queue(lock_dir, key)
+                if queue and os.path.basename(ticket) == queue[0][3]:
+                    limit = sched_limit(lock_dir, key)
+                    fd = try_slots(lock_dir, key, allowed_slots(limit, priority))
+                if fd is None:
+                    queued = True
+                    time.sleep(POLL_INTERVAL)
+        finally:
+            with contextlib.suppress(OSError):
+                os.unlink(ticket)
+        wait = time.monotonic() - started if queued else 0.0
+        record_metric(
+            "queue_wait", endpoint=urlsplit(url).netloc, priority=priority,
+            wait_ms=round(wait * 1000, 1), limit=limit, queued=queued
+        )
+
+    try:
+        yield wait
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+    return None
+
+
+def report_completion(url: str, sample: Dict[str, Any]) -> None:
+    """Feeds a completion's TTFT / decode rate to the adaptive limit, if enabled."""
+    if adaptive_enabled() and HAS_FCNTL:
+        observe(_sched_dir(), _endpoint_key(url), urlsplit(url).netloc, sample)
+    return None
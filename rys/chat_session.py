@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chat Session Setup (v0.5)
+
+Purpose:
+  Builds the ChatConfig and the initial message list from parsed arguments.
+  Shared by chat_core.py and in-process orchestrators that call roles directly.
+
+History:
+  1. 2026-10-19 Initial version (split from chat_core.py)
+  2. 2026-10-19 No connection check when replaying a cassette
+  3. 2026-10-19 Model and endpoint are routed per role (chat_route.py)
+  4. 2026-10-19 OpenAI-compatible or native Ollama backend (chat_backends.py)
+  5. 2026-10-19 An explicit --model wins over the routing file
+"""
+# pylint: disable=useless-return
+
+import argparse
+from typing import Dict, List
+
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from chat_api import verify_connection, load_session_data, build_base_url
+from chat_backends import get_backend, resolve_backend
+from chat_cassette import cassette_mode
+from chat_route import route_role
+from chat_sched import resolve_priority
+
+
+def build_chat_config(args: argparse.Namespace) -> ChatConfig:
+    """Resolves the role's endpoint, checks it is reachable and builds the ChatConfig."""
+    insecure_flag = getattr(args, "insecure", False)
+    role = getattr(args, "role", "") or ""
+    live = not cassette_mode().startswith("replay")
+    # Routing-file entries apply only when no model was given explicitly.
+    base_url, model = route_role(
+        role, build_base_url(args.host, args.port), args.model or None, insecure_flag, probe=live
+    )
+    backend_name, base_url = resolve_backend(base_url)
+    backend = get_backend(backend_name)
+
+    # Replayed runs need no model server at all.
+    if live:
+        verify_connection(base_url, insecure=insecure_flag, path=backend.models_path)
+
+    return ChatConfig(
+        api_url=f"{base_url.rstrip('/')}{backend.chat_path}",
+        model=model,
+        quiet_mode=args.quit,
+        stream_output=args.stream,
+        insecure=insecure_flag,
+        priority=resolve_priority(getattr(args, "priority", None), args.quit),
+        role=role,
+        backend=backend_name
+    )
+
+
+def init_messages(args: argparse.Namespace, colors: TerminalColors) -> List[Dict[str, str]]:
+    """Starts from the system prompt, replaced or extended by a loaded session."""
+    messages = [{"role": "system", "content": args.system}]
+    loaded_session = load_session_data(args.session_file, args.session_json)
+    if loaded_session:
+        if loaded_session[0].get("role") == "system":
+            messages = loaded_session
+        else:
+            messages.extend(loaded_session)
+        if not args.quit:
+            msg = f"[Session Loaded] {len(loaded_session)} messages."
+            print(colors.colorize(msg, colors.sys_color))
+    return messages
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ticket and Slot Files of the Request Scheduler (v0.1)
+
+Purpose:
+  The lock-directory side of chat_sched.py. A waiter's ticket is named
+  <key>.wait.<class>.<arrival ns>.<pid>.<thread>; tickets of dead processes
+  are removed. A slot is the file <key>.slot.<n> held with a non-blocking
+  flock(), so a crashed holder frees it automatically. The first
+  RYS_SCHED_RESERVE slots are kept for the 'interactive' class.
+
+History:
+  1. 2026-10-19 Initial version (split from chat_sched.py)
+"""
+# pylint: disable=useless-return
+
+import os
+import contextlib
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+def _pid_alive(pid: int) -> bool:
+    """True if the process still exists."""
+    alive = True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        alive = False
+    except PermissionError:
+        alive = True
+    return alive
+
+
+def ticket_queue(lock_dir: str, key: str) -> List[Tuple[int, int, int, str]]:
+    """Returns live tickets sorted by (class, per-owner rank, arrival)."""
+    tickets = []
+    prefix = f"{key}.wait."
+    for name in os.listdir(lock_dir):
+        if name.startswith(prefix):
+            prio, seq, owner = name[len(prefix):].split(".")[:3]
+            if _pid_alive(int(owner)):
+                tickets.append((int(prio), int(seq), owner, name))
+            else:
+                with contextlib.suppress(OSError):
+                    os.unlink(os.path.join(lock_dir, name))
+    tickets.sort()
+
+    ranked = []
+    seen = {}
+    for prio, seq, owner, name in tickets:
+        rank = seen.get((prio, owner), 0)
+        seen[(prio, owner)] = rank + 1
+        ranked.append((prio, rank, seq, name))
+    ranked.sort()
+    return ranked
+
+
+def try_slots(lock_dir: str, key: str, slots: range) -> Optional[int]:
+    """Tries to flock one of the given slot files; returns the open fd or None."""
+    held = None
+    for index in slots:
+        fd = os.open(os.path.join(lock_dir, f"{key}.slot.{index}"), os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            held = fd
+            break
+        except OSError:
+            os.close(fd)
+    return held
+
+
+def allowed_slots(limit: int, priority: str) -> range:
+    """Slots a class may occupy; the first RESERVE slots are interactive-only."""
+    default_reserve = "1" if limit > 1 else "0"
+    reserve = min(int(os.environ.get("RYS_SCHED_RESERVE", default_reserve)), limit - 1)
+    start = 0 if priority == "interactive" else max(reserve, 0)
+    return range(start, limit)
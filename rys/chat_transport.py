@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Completion Transport (v0.3)
+
+Purpose:
+  The single place where a completion request is sent. Waits for a scheduler
+  slot, opens the HTTP response and hands back its raw chunks (SSE lines, or
+  the un-gzipped body for non-streaming requests). Cassette record/replay
+  (chat_cassette.py) hooks in here, so everything above it runs unchanged.
+
+History:
+  1. 2026-10-19 Initial version (split from chat_api.py / chat_oneshot.py)
+  2. 2026-10-19 TTFT / decode rate / overload errors feed the adaptive limit
+  3. 2026-10-19 Recorded chunk offsets include the wait for the response headers
+"""
+# pylint: disable=useless-return
+
+import ssl
+import time
+import gzip
+import json
+import contextlib
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Iterator, Optional
+
+from chat_cassette import CassetteRecorder, cassette_mode, replay_chunks
+from chat_meter import CompletionMeter
+from chat_sched import report_completion, scheduled_slot
+from chat_types import ChatConfig
+
+
+def get_ssl_context(insecure: bool) -> Optional[ssl.SSLContext]:
+    """Returns an SSL context, possibly unverified."""
+    ctx = None
+    if insecure:
+        # pylint: disable=protected-access
+        ctx = ssl._create_unverified_context()
+    return ctx
+
+
+def _read_body(response: Any) -> bytes:
+    """Reads the complete body, undoing gzip transfer compression."""
+    body = response.read()
+    if response.headers.get("Content-Encoding", "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
+@contextlib.contextmanager
+def open_completion(config: ChatConfig, payload: Dict[str, Any]) -> Iterator[Iterator[bytes]]:
+    """Sends the request; yields an iterator over the raw response chunks."""
+    mode = cassette_mode()
+    stream = bool(payload.get("stream"))
+    headers = {"Content-Type": "application/json", "Authorization": "Bearer not-needed"}
+    if not stream:
+        headers["Accept-Encoding"] = "gzip"
+
+    if mode.startswith("replay"):
+        yield replay_chunks(config.api_url, payload, timed=mode == "replay-timed")
+    else:
+        req = urllib.request.Request(
+            config.api_url, data=json.dumps(payload).encode("utf-8"), headers=headers
+        )
+        ctx = get_ssl_context(config.insecure)
+        with scheduled_slot(config.api_url, config.priority) as wait:
+            meter = CompletionMeter(payload, wait)
+            ok = None  # None: the outcome says nothing about backend capacity
+            try:
+                sent = time.monotonic()
+                with urllib.request.urlopen(req, context=ctx) as response:
+                    chunks = meter.wrap(iter(response) if stream else iter([_read_body(response)]))
+                    recorder = None
+                    if mode == "record":
+                        recorder = CassetteRecorder(config.api_url, payload, chunks, sent)
+                    try:
+                        yield iter(recorder) if recorder else chunks
+                    finally:
+                        if recorder:
+                            recorder.save()
+                ok = True
+            except urllib.error.HTTPError as exc:
+                ok = False if exc.code == 429 or exc.code >= 500 else None
+                raise
+            except OSError:
+                ok = False
+                raise
+            finally:
+                if ok is not None:
+                    report_completion(config.api_url, meter.finish(ok))
+
+    return None
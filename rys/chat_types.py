@@ -1,23 +1,32 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Chat Types and Constants (v0.1)
+Chat Types and Constants (v0.5)
 
 History:
   1. 2026-02-07 Initial version (split from chat_core.py)
+  2. 2026-10-19 Added scheduler priority class
+  3. 2026-10-19 Added role name for usage attribution
+  4. 2026-10-19 Added wire-format backend name (chat_backends.py)
+  5. 2026-10-19 DEFAULT_MODEL (used when no --model is given)
 """
 # pylint: disable=useless-return
 
 from dataclasses import dataclass
 
+DEFAULT_MODEL = "gemma3n:e4b"
+
 @dataclass
-class ChatConfig:
+class ChatConfig:  # pylint: disable=too-many-instance-attributes
     """Holds configuration for the chat session."""
     api_url: str
     model: str
     quiet_mode: bool
     stream_output: bool
     insecure: bool = False
+    priority: str = "pipeline"
+    role: str = ""
+    backend: str = "openai"
 
     def __post_init__(self) -> None:
         """Validation after initialization."""
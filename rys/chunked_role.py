@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Map-reduce Translater / Dispatcher for Long Inputs (v0.2)
+
+Purpose:
+  When the prompt exceeds the chunk budget (--chunk-tokens or
+  RYS_CHUNK_TOKENS), it is split by text_chunks.split_chunks() and every
+  chunk is sent with the same system prompt in parallel (RYS_CHUNK_JOBS,
+  default 4; the scheduler still bounds in-flight requests per endpoint).
+  Answers are reduced in chunk order whatever order they finish in:
+  translations are joined as paragraphs, Dispatcher TOPIC lines are merged
+  and deduplicated before they reach group_requests. With --structured the
+  merged TOPIC lines are validated and repaired like an unchunked answer;
+  repairs carry only the system prompt and the malformed lines.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 --structured validates the merged Dispatcher answer
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from chat_metrics import record_metric
+from chat_oneshot import complete_chat
+from chat_session import build_chat_config
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from structured_role import validate_and_print
+from text_chunks import merge_topics, split_chunks
+from token_usage import estimate_tokens
+
+CHUNKED_ROLES = ("translater", "dispatcher")
+
+
+def chunk_budget(requested: int) -> int:
+    """Token budget per chunk; 0 disables chunking."""
+    return requested or int(os.environ.get("RYS_CHUNK_TOKENS", "0") or 0)
+
+
+def needs_chunking(role: str, prompt: str, budget: int) -> bool:
+    """Only long inputs to the translater and dispatcher are chunked."""
+    return bool(budget) and role in CHUNKED_ROLES and estimate_tokens(prompt) > budget
+
+
+def map_chunks(config: ChatConfig, system: str, chunks: List[str], jobs: int) -> List[str]:
+    """Answers every chunk; the result list is in chunk order."""
+    colors = TerminalColors(enable_color=False)
+
+    def ask(chunk: str) -> str:
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": chunk}]
+        return complete_chat(config, messages, colors)["content"]
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        answers = list(pool.map(ask, chunks))
+    return answers
+
+
+def reduce_answers(role: str, answers: List[str]) -> str:
+    """Joins translations as paragraphs; merges and dedupes TOPIC lines."""
+    if role == "dispatcher":
+        output = "\n".join(merge_topics(answers))
+    else:
+        output = "\n\n".join(a.strip() for a in answers if a.strip())
+    return output
+
+
+def run_chunked_role(
+    args: argparse.Namespace, budget: int, skill_ids: Optional[List[str]] = None
+) -> None:
+    """Runs the role over the chunks of args.prompt and prints the reduced answer.
+
+    skill_ids (structured Dispatcher only) turns on validation of the merged lines.
+    """
+    config = build_chat_config(args)
+    chunks = split_chunks(args.prompt, budget)
+    jobs = int(os.environ.get("RYS_CHUNK_JOBS", "4") or 4)
+
+    started = time.monotonic()
+    answers = map_chunks(config, args.system, chunks, jobs)
+    failed = [a.strip() for a in answers if "[Connection Error]" in a or "[Error]" in a]
+    if failed:
+        raise RuntimeError(f"{len(failed)}/{len(chunks)} chunks failed: {failed[0]}")
+    output = reduce_answers(args.role, answers)
+    elapsed = time.monotonic() - started
+
+    sys.stderr.write(
+        f"[chunked] {args.role}: {len(args.prompt)} chars in {len(chunks)} chunks "
+        f"(<= {budget} tokens, {jobs} parallel) in {elapsed:.1f}s\n"
+    )
+    record_metric(
+        "chunked", role=args.role, chars=len(args.prompt), chunks=len(chunks), budget=budget,
+        jobs=jobs, duration_ms=round(elapsed * 1000, 1), output_lines=len(output.splitlines())
+    )
+    if skill_ids is not None and args.role == "dispatcher":
+        history = [{"role": "system", "content": args.system}]
+        validate_and_print(args, config, history, output.splitlines(), skill_ids)
+    else:
+        print(output)
+    return None
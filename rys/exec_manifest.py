@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Step Manifest for the Workflow Executor (v0.1)
+
+Purpose:
+  Parses the manifest read by exec_plan.py
+  (index \\t skill_id \\t script_file [\\t depends_on_indices]) into steps.
+  Steps of one REQUEST run in file order; a REQUEST listed in the 4th
+  column (e.g. "1,3") must finish all of its steps first, wherever it
+  appears in the file. Unknown REQUESTs and cycles are rejected.
+
+  main.bash writes three columns only (its REQUESTs are independent); the
+  4th column is for manifests written by hand or by other front ends.
+
+History:
+  1. 2026-10-19 Initial version (split from exec_plan.py)
+"""
+# pylint: disable=useless-return
+
+from typing import Any, Dict, List
+
+
+def _check_acyclic(steps: List[Dict[str, Any]]) -> None:
+    """Raises ValueError when the step dependencies contain a cycle."""
+    deps = {s["id"]: set(s["deps"]) for s in steps}
+    while deps:
+        ready = [step_id for step_id, needs in deps.items() if not needs & deps.keys()]
+        if not ready:
+            raise ValueError(f"dependency cycle among {', '.join(sorted(deps))}")
+        for step_id in ready:
+            del deps[step_id]
+    return None
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Parses manifest rows into steps with explicit step dependencies."""
+    steps: List[Dict[str, Any]] = []
+    last_in_request: Dict[str, str] = {}
+    with open(path, 'r', encoding='utf-8') as f_in:
+        rows = [ln.rstrip("\n").split("\t") for ln in f_in if ln.strip()]
+
+    for row in rows:
+        index, skill, script = row[0], row[1], row[2]
+        declared = [d.strip() for d in (row[3] if len(row) > 3 else "").split(",") if d.strip()]
+        step_id = f"R{index}.{sum(1 for s in steps if s['request'] == index) + 1}"
+        deps = [s for s in [last_in_request.get(index)] if s]
+        steps.append({"id": step_id, "request": index, "skill": skill,
+                      "script": script, "deps": deps, "declared": declared})
+        last_in_request[index] = step_id
+
+    unknown = {d for s in steps for d in s["declared"]} - {s["request"] for s in steps}
+    if unknown:
+        raise ValueError(f"dependencies on unknown REQUESTs: {', '.join(sorted(unknown))}")
+    # Declared REQUESTs resolve after all rows are read: a step waits for every
+    # step of them, wherever they appear in the file.
+    for step in steps:
+        step["deps"] += [s["id"] for s in steps
+                         if s["request"] in step["declared"] and s["request"] != step["request"]]
+    _check_acyclic(steps)
+    return steps
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel Executor for Approved Workflows (v0.4)
+
+Purpose:
+  Reads the step manifest written by main.bash
+  (index \\t skill_id \\t script_file [\\t depends_on_indices]), builds a
+  dependency DAG and runs ready steps concurrently in a bounded pool.
+  REQUESTs are independent unless the 4th column declares dependencies
+  (e.g. "1,3"); steps within one REQUEST run in order. Each step is
+  screened and run by exec_step.py. Per-step timing and exit status are
+  written to the run record.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Manifest parsing moved to exec_manifest.py
+  3. 2026-10-19 Scripts matching a config/risks.json pattern are blocked, not run
+  4. 2026-10-19 Step screening and running moved to exec_step.py; --mode
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Pattern, Tuple
+
+from exec_manifest import load_manifest
+from exec_step import SCREENED_SEVERITIES, run_step, screen_patterns
+
+
+def execute(
+    steps: List[Dict[str, Any]], jobs: int, risks: List[Tuple[str, Pattern[str]]]
+) -> List[Dict[str, Any]]:
+    """Runs the DAG; dependents of unsuccessful (or blocked) steps are skipped."""
+    done: Dict[str, Dict[str, Any]] = {}
+    pending = {s["id"]: s for s in steps}
+    running: Dict[Any, str] = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for step_id, step in list(pending.items()):
+                if any(done.get(d, {}).get("status") not in (None, "ok") for d in step["deps"]):
+                    done[step_id] = {k: step[k] for k in ("id", "request", "skill", "deps")}
+                    done[step_id].update(status="skipped", exit_code=None, duration_s=0.0)
+                    del pending[step_id]
+                elif all(d in done for d in step["deps"]):
+                    running[pool.submit(run_step, step, risks)] = step_id
+                    del pending[step_id]
+            if running:
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done[running.pop(future)] = future.result()
+
+    return [done[s["id"]] for s in steps]
+
+
+def main() -> int:
+    """Main entry point; non-zero unless every step succeeded."""
+    parser = argparse.ArgumentParser(description="Parallel Workflow Executor")
+    parser.add_argument("--manifest", required=True, help="Step manifest (TSV)")
+    parser.add_argument("--record", required=True, help="Run record output (JSON)")
+    parser.add_argument("--jobs", "-j", type=int,
+                        default=int(os.environ.get("RYS_EXEC_JOBS", "0")) or os.cpu_count() or 1,
+                        help="Concurrent steps (default: RYS_EXEC_JOBS or CPU count)")
+    parser.add_argument("--mode", choices=list(SCREENED_SEVERITIES),
+                        default=os.environ.get("RYS_EXECUTE") or "pass",
+                        help="Execute mode; selects the screened risk severities")
+    args = parser.parse_args()
+    exit_code = 1
+
+    try:
+        steps = load_manifest(args.manifest)
+        started = time.monotonic()
+        risks = screen_patterns(args.mode)
+        results = execute(steps, max(args.jobs, 1), risks)
+        record = {
+            "run": os.environ.get("RYS_RUN_ID", ""), "jobs": args.jobs,
+            "wall_s": round(time.monotonic() - started, 3), "steps": results,
+        }
+        with open(args.record, 'w', encoding='utf-8') as f_out:
+            json.dump(record, f_out, indent=2, ensure_ascii=False)
+        for res in results:
+            print(f"{res['id']:<8}{res['skill']:<16}{res['status']:<9}"
+                  f"exit={res['exit_code']} {res['duration_s']:.2f}s")
+        print(f"Wall time {record['wall_s']:.2f}s with {args.jobs} job(s). Record: {args.record}")
+        exit_code = 0 if all(res["status"] == "ok" for res in results) else 1
+    except (OSError, ValueError) as exc:
+        sys.stderr.write(f"Error: {exc}\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
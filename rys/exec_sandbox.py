@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-skill Sandboxed Step Runner (v0.1)
+
+Purpose:
+  Runs one generated script under the sandbox configured for its skill in
+  config/sandbox.json: working directory, minimal environment, timeout
+  (the whole process group is killed) and a cap on captured output. Output
+  lines are streamed to a callback while the step runs.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return
+
+import os
+import re
+import json
+import time
+import shutil
+import signal
+import tempfile
+import threading
+import subprocess
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+INTERPRETERS = {"bash": "bash", "sh": "bash", "shell": "bash", "python": "python3", "py": "python3"}
+FENCE_RE = re.compile(r"```([A-Za-z0-9_+-]*)[ \t]*\n(.*?)```", re.DOTALL)
+
+
+@dataclass
+class SandboxSpec:
+    """Sandbox settings for one skill."""
+    cwd: str = "scratch"
+    timeout: float = 30.0
+    max_output_bytes: int = 65536
+    pass_env: List[str] = field(default_factory=lambda: ["PATH", "HOME", "LANG"])
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+def load_sandbox_spec(config_dir: str, skill_id: str) -> SandboxSpec:
+    """Merges the default sandbox with the skill's overrides."""
+    with open(os.path.join(config_dir, "sandbox.json"), 'r', encoding='utf-8') as f_in:
+        data = json.load(f_in)
+    merged = dict(data.get("default", {}))
+    merged.update(data.get("skills", {}).get(skill_id, {}))
+    known = {f.name for f in fields(SandboxSpec)}
+    return SandboxSpec(**{k: v for k, v in merged.items() if k in known})
+
+
+def extract_script(text: str) -> Tuple[str, str]:
+    """Returns (interpreter, code) from the first fenced block; raises ValueError."""
+    match = FENCE_RE.search(text)
+    if not match:
+        raise ValueError("no fenced code block in generated output")
+    interpreter = INTERPRETERS.get(match.group(1).lower() or "bash")
+    if interpreter is None:
+        raise ValueError(f"unsupported script language '{match.group(1)}'")
+    return interpreter, match.group(2)
+
+
+def _pump(pipe: Any, name: str, limit: int, sink: Dict[str, Any], emit: Callable) -> None:
+    """Streams one pipe line by line, keeping at most `limit` bytes."""
+    for raw in iter(pipe.readline, b""):
+        sink[f"{name}_bytes"] += len(raw)
+        room = limit - len(sink[name])
+        if room > 0:
+            sink[name] += raw[:room]
+            emit(name, raw.decode("utf-8", "replace").rstrip("\n"))
+        else:
+            sink["truncated"] = True
+    pipe.close()
+    return None
+
+
+def _build_env(spec: SandboxSpec, workdir: str) -> Dict[str, str]:
+    """Minimal environment: allow-listed variables plus the skill's own."""
+    env = {k: os.environ[k] for k in spec.pass_env if k in os.environ}
+    env.update({"TMPDIR": workdir, **spec.env})
+    return env
+
+
+def _wait_script(
+    argv: List[str], workdir: str, spec: SandboxSpec,
+    result: Dict[str, Any], emit: Callable[[str, str], None]
+) -> None:
+    """Runs argv in its own process group, killing the group on timeout."""
+    with subprocess.Popen(
+        argv, cwd=workdir, env=_build_env(spec, os.path.dirname(argv[1])),
+        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        start_new_session=True,
+    ) as proc:
+        pumps = [
+            threading.Thread(target=_pump, args=(
+                getattr(proc, name), name, spec.max_output_bytes, result, emit))
+            for name in ("stdout", "stderr")
+        ]
+        for pump in pumps:
+            pump.start()
+        try:
+            result["exit_code"] = proc.wait(timeout=spec.timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            result["exit_code"] = proc.wait()
+            result["status"] = "timeout"
+        for pump in pumps:
+            pump.join()
+    return None
+
+
+def run_script(
+    script_text: str,
+    spec: SandboxSpec,
+    emit: Callable[[str, str], None],
+    base_cwd: Optional[str] = None
+) -> Dict[str, Any]:
+    """Runs the script; returns status, exit code, timing and captured output."""
+    result: Dict[str, Any] = {
+        "status": "ok", "exit_code": None, "duration_s": 0.0, "truncated": False,
+        "stdout": b"", "stderr": b"", "stdout_bytes": 0, "stderr_bytes": 0,
+    }
+    scratch = tempfile.mkdtemp(prefix="rys-step-")
+    started = time.monotonic()
+    try:
+        interpreter, code = extract_script(script_text)
+        script_path = os.path.join(scratch, "step.py" if interpreter == "python3" else "step.sh")
+        with open(script_path, 'w', encoding='utf-8') as f_out:
+            f_out.write(code)
+        workdir = scratch if spec.cwd == "scratch" else os.path.abspath(
+            os.path.join(base_cwd or os.getcwd(), spec.cwd))
+        _wait_script([interpreter, script_path], workdir, spec, result, emit)
+        if result["status"] == "ok" and result["exit_code"] != 0:
+            result["status"] = "failed"
+    except (ValueError, OSError) as exc:
+        result["status"] = "error"
+        result["stderr"] = str(exc).encode("utf-8")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    result["duration_s"] = round(time.monotonic() - started, 3)
+    result["stdout"] = result["stdout"].decode("utf-8", "replace")
+    result["stderr"] = result["stderr"].decode("utf-8", "replace")
+    return result
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Screened Step Runner for the Workflow Executor (v0.1)
+
+Purpose:
+  Runs one manifest step for exec_plan.py in its skill's sandbox
+  (exec_sandbox.py), prefixing every output line with the step id. A script
+  matching a config/risks.json pattern is blocked instead of run: every
+  category under RYS_EXECUTE=pass, only high_severity ones under warn (the
+  auditor already accepted medium risks with [WARN]). Blocked steps and
+  steps that could not start (e.g. no fenced code block) are reported on
+  stderr as well as in the run record.
+
+History:
+  1. 2026-10-19 Initial version (split from exec_plan.py)
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import time
+import threading
+from typing import Any, Dict, List, Pattern, Tuple
+
+from chat_metrics import record_metric
+from exec_sandbox import load_sandbox_spec, run_script
+from role_utils import load_risk_patterns, matched_risks
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "config")
+PRINT_LOCK = threading.Lock()
+# Risk severities screened per RYS_EXECUTE mode (None: every category)
+SCREENED_SEVERITIES = {"pass": None, "warn": ("high_severity",)}
+
+
+def screen_patterns(mode: str) -> List[Tuple[str, Pattern[str]]]:
+    """Risk patterns that block a step under the given execute mode."""
+    return load_risk_patterns(os.path.join(CONFIG_DIR, "risks.json"), SCREENED_SEVERITIES[mode])
+
+
+def run_step(step: Dict[str, Any], risks: List[Tuple[str, Pattern[str]]]) -> Dict[str, Any]:
+    """Runs one step in its skill's sandbox (unless it matches a risk pattern),
+    streaming prefixed output lines."""
+    def emit(stream: str, line: str) -> None:
+        with PRINT_LOCK:
+            target = sys.stdout if stream == "stdout" else sys.stderr
+            target.write(f"[{step['id']} {step['skill']}] {line}\n")
+            target.flush()
+
+    script_text = ""
+    try:
+        with open(step["script"], 'r', encoding='utf-8') as f_in:
+            script_text = f_in.read()
+    except OSError as exc:
+        emit("stderr", f"cannot read script: {exc}")
+    started = time.time()
+    hits = matched_risks(script_text, risks)
+    if hits:
+        emit("stderr", f"blocked: script matches risk patterns: {', '.join(hits)}")
+        result = {"status": "blocked", "exit_code": None, "duration_s": 0.0,
+                  "stdout_bytes": 0, "truncated": False}
+    else:
+        result = run_script(script_text, load_sandbox_spec(CONFIG_DIR, step["skill"]), emit)
+        if result["status"] == "error":
+            emit("stderr", f"error: {result['stderr']}")
+    result.update({k: step[k] for k in ("id", "request", "skill", "deps")})
+    result["started"] = round(started, 3)
+    record_metric("exec_step", **{k: result[k] for k in (
+        "id", "skill", "status", "exit_code", "duration_s", "stdout_bytes", "truncated")})
+    return result
@@ -27,6 +27,8 @@ except ImportError:
     # Fallback if running from a different CWD
     sys.path.append(os.path.join(SCRIPT_DIR, "../rys"))
     from chat_core import run_chat_session
+# chat_core resolved the path; chat_sched sits next to it.
+from chat_sched import PRIORITY_CLASSES  # pylint: disable=wrong-import-position
 
 
 def main() -> None:
@@ -41,7 +43,7 @@ def main() -> None:
     parser.add_argument("--host", default="localhost", help="Target Host IP")
     parser.add_argument("--port", "-p", help="Target Port")
     parser.add_argument(
-        "--model", "-m", default="gemma3n:e4b", help="Model name"
+        "--model", "-m", help="Model name (default: gemma3n:e4b)"
     )
     parser.add_argument(
         "--insecure", "-k", action="store_true",
@@ -77,6 +79,14 @@ def main() -> None:
         "--no-color", action="store_true", default=False, help=argparse.SUPPRESS
     )
 
+    parser.add_argument(
+        "--priority", choices=list(PRIORITY_CLASSES),
+        help="Scheduler priority class (default: RYS_PRIORITY or by mode)"
+    )
+    parser.add_argument(
+        "--prime", action="store_true",
+        help="Interactive: warm the server's prompt cache while typing (or RYS_PRIME=1)"
+    )
     parser.add_argument("--session-file", help=argparse.SUPPRESS)
     parser.add_argument("--session-json", help=argparse.SUPPRESS)
 
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Invoke Role Wrapper (v0.6)
-Update: Added --risks support for the Auditor role.
+Invoke Role Wrapper (v0.11)
+Update: Planner/engineer/refiner can pick the best of several candidates.
 
 History:
   2. 2026-02-07 Refactored and split for Pylint compliance
+  3. 2026-10-19 Added --priority and --structured
+  4. 2026-10-19 Added --chunk-tokens (map-reduce over long inputs)
+  5. 2026-10-19 Added --candidates (best of N answers)
+  6. 2026-10-19 No --model default: an explicit model wins over config/routing.json
+  7. 2026-10-19 --structured also validates chunked Dispatcher output
 """
 # pylint: disable=duplicate-code,useless-return,broad-exception-caught
 
@@ -15,8 +20,12 @@ import argparse
 import json
 from typing import List, Optional
 
+from candidate_role import CANDIDATE_ROLES, candidate_count, run_candidate_role
 from chat_core import run_chat_session
-from role_utils import construct_system_prompt
+from chat_sched import PRIORITY_CLASSES
+from chunked_role import chunk_budget, needs_chunking, run_chunked_role
+from role_utils import construct_system_prompt, load_skills_data
+from structured_role import STRUCTURED_ROLES, run_structured_role
 
 # Setup path to import chat_core
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -40,6 +49,16 @@ def parse_skills_arg(value: Optional[str]) -> Optional[List[str]]:
     return [s.strip() for s in val.split(',') if s.strip()]
 
 
+def _skill_ids(config_dir: str, skill_filter: Optional[List[str]]) -> List[str]:
+    """Skill ids the structured Dispatcher accepts."""
+    skills = load_skills_data(config_dir, skill_filter)
+    ids = (
+        [str(s.get("id")) for s in skills if isinstance(s, dict)]
+        if isinstance(skills, list) else list(skills)
+    )
+    return ids
+
+
 def main() -> None:
     """Main execution routine."""
     parser = argparse.ArgumentParser(description="Invoke Role Wrapper")
@@ -50,9 +69,23 @@ def main() -> None:
         help="Include skills."
     )
     parser.add_argument("--risks", help="Path to risks.json file")
+    parser.add_argument(
+        "--structured", nargs='?', const='json', choices=["json", "text"],
+        help="Validate dispatcher/titler output and re-ask for malformed lines only"
+    )
+    parser.add_argument(
+        "--chunk-tokens", type=int, default=0,
+        help="Translater/dispatcher: split longer inputs into chunks (or RYS_CHUNK_TOKENS)"
+    )
+    parser.add_argument(
+        "--candidates", type=int, default=0,
+        help="Planner/engineer/refiner: keep the best of N answers (or RYS_CANDIDATES)"
+    )
     parser.add_argument("--host", default="localhost", help="Target Host IP")
     parser.add_argument("--port", "-p", help="Target Port")
-    parser.add_argument("--model", "-m", default="gemma3n:e4b", help="Model name")
+    parser.add_argument(
+        "--model", "-m", help="Model name (default: the role's route, else gemma3n:e4b)"
+    )
     parser.add_argument(
         "--insecure", "-k", action="store_true",
         help="Skip SSL certificate verification"
@@ -71,6 +104,10 @@ def main() -> None:
         "--no-color", action="store_true", default=True, help=argparse.SUPPRESS
     )
     parser.add_argument("--system", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--priority", choices=list(PRIORITY_CLASSES),
+        help="Scheduler priority class (default: RYS_PRIORITY or by mode)"
+    )
     parser.add_argument("--session-file", help=argparse.SUPPRESS)
     parser.add_argument("--session-json", help=argparse.SUPPRESS)
 
@@ -93,7 +130,18 @@ def main() -> None:
         args.system = construct_system_prompt(
             base_dir, args.role, skill_filter, include_skills, args.risks
         )
-        run_chat_session(args)
+        skill_ids = None
+        if args.structured and args.role in STRUCTURED_ROLES:
+            skill_ids = _skill_ids(os.path.join(base_dir, "config"), skill_filter)
+        budget = chunk_budget(args.chunk_tokens)
+        if needs_chunking(args.role, args.prompt, budget):
+            run_chunked_role(args, budget, skill_ids)
+        elif skill_ids is not None:
+            run_structured_role(args, skill_ids)
+        elif candidate_count(args.candidates) > 1 and args.role in CANDIDATE_ROLES:
+            run_candidate_role(args, candidate_count(args.candidates))
+        else:
+            run_chat_session(args)
     except Exception as exc:  # pylint: disable=broad-exception-caught
         sys.stderr.write(f"Error: {exc}\n")
         sys.exit(1)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local Language Detector and Task Segmenter (v0.1)
+
+Purpose:
+  Decides without any network call whether the input is confidently English.
+  Exit 0 prints the input split into task sentences (translater bypassed),
+  exit 3 means the translater role is still required.
+
+History:
+  1. 2026-10-19 Initial version (translater bypass and shadow mode)
+"""
+# pylint: disable=useless-return
+
+import os
+import re
+import sys
+import json
+import argparse
+from typing import Dict, List, Tuple
+
+from lang_shadow import DEFAULT_SHADOW_LOG, run_shadow
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STOPWORDS_FILE = os.path.join(os.path.dirname(SCRIPT_DIR), "config", "stopwords.json")
+MIN_EVIDENCE = 3
+EXIT_NEEDS_TRANSLATION = 3
+
+# (script name, first code point, last code point)
+SCRIPT_RANGES = [
+    ("ja", 0x3040, 0x30FF), ("zh", 0x3400, 0x4DBF), ("zh", 0x4E00, 0x9FFF),
+    ("ko", 0xAC00, 0xD7AF), ("ko", 0x1100, 0x11FF), ("ru", 0x0400, 0x04FF),
+    ("el", 0x0370, 0x03FF), ("he", 0x0590, 0x05FF), ("ar", 0x0600, 0x06FF),
+    ("hi", 0x0900, 0x097F), ("th", 0x0E00, 0x0E7F), ("latin_ext", 0x00C0, 0x024F),
+]
+
+
+def load_stopwords(path: str = STOPWORDS_FILE) -> Dict[str, set]:
+    """Loads the per-language stopword sets."""
+    with open(path, 'r', encoding='utf-8') as f_in:
+        data = json.load(f_in)
+    return {lang: set(words) for lang, words in data.get("languages", {}).items()}
+
+
+def _char_script(char: str) -> str:
+    """Returns the script bucket of a single letter."""
+    script = "latin" if char.isascii() else "other"
+    code = ord(char)
+    for name, first, last in SCRIPT_RANGES:
+        if first <= code <= last:
+            script = name
+            break
+    return script
+
+
+def count_scripts(text: str) -> Dict[str, int]:
+    """Counts letters per script bucket."""
+    counts: Dict[str, int] = {}
+    for char in text:
+        if char.isalpha():
+            script = _char_script(char)
+            counts[script] = counts.get(script, 0) + 1
+    return counts
+
+
+def _lexical_scores(text: str, stopwords: Dict[str, set]) -> Dict[str, int]:
+    """Counts stopword hits per language."""
+    words = re.findall(r"[^\W\d_]+", text.lower())
+    return {lang: sum(1 for w in words if w in vocab) for lang, vocab in stopwords.items()}
+
+
+def _script_verdict(counts: Dict[str, int], total: int) -> Tuple[str, float]:
+    """Verdict for text dominated by a non-Latin script."""
+    foreign = {k: v for k, v in counts.items() if k not in ("latin", "latin_ext")}
+    lang = "ja" if "ja" in foreign else max(foreign, key=foreign.get)
+    share = sum(foreign.values()) if lang == "ja" else foreign[lang]
+    return lang, share / total
+
+
+def _lexical_verdict(text: str, stopwords: Dict[str, set], purity: float) -> Tuple[str, float]:
+    """Verdict for Latin-script text from stopword hits (ties favour English)."""
+    scores = _lexical_scores(text, stopwords)
+    ranked = sorted(scores.items(), key=lambda kv: (kv[1], kv[0] == "en"), reverse=True)
+    result = ("unknown", 0.0)
+    if ranked and ranked[0][1]:
+        best_lang, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        evidence = min(1.0, best / MIN_EVIDENCE)
+        result = (best_lang, best / (best + runner_up) * evidence * purity)
+    return result
+
+
+def detect_language(text: str, stopwords: Dict[str, set]) -> Tuple[str, float]:
+    """Returns (language code, confidence in [0, 1])."""
+    counts = count_scripts(text)
+    total = sum(counts.values())
+    result = ("unknown", 0.0)
+
+    if total:
+        latin = counts.get("latin", 0) + counts.get("latin_ext", 0)
+        if latin / total < 0.5:
+            result = _script_verdict(counts, total)
+        else:
+            result = _lexical_verdict(text, stopwords, counts.get("latin", 0) / total)
+
+    return result
+
+
+def is_confident_english(text: str, threshold: float, stopwords: Dict[str, set]) -> bool:
+    """True when the detector is sure enough to skip the translater."""
+    lang, confidence = detect_language(text, stopwords)
+    return lang == "en" and confidence >= threshold
+
+
+def segment_tasks(text: str) -> List[str]:
+    """Splits text into task sentences, keeping each sentence verbatim."""
+    sentences = []
+    for para in re.split(r"\n+", text):
+        para = re.sub(r"^\s*(?:[-*•]|\d+[.)])\s+", "", para).strip()
+        parts = re.split(r"(?<=[.!?;])\s+(?=[A-Z0-9\"'(])", para)
+        sentences.extend(p.strip() for p in parts if p.strip())
+    return sentences
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Local Language Detector")
+    parser.add_argument("--prompt", help="Input text (reads from stdin if omitted)")
+    parser.add_argument(
+        "--threshold", type=float,
+        default=float(os.environ.get("RYS_LANG_THRESHOLD", "0.8")),
+        help="Confidence required to bypass the translater"
+    )
+    parser.add_argument("--compare", help="Shadow mode: translater output file to compare")
+    parser.add_argument(
+        "--shadow-log", default=os.environ.get("RYS_LANG_SHADOW_LOG", DEFAULT_SHADOW_LOG),
+        help="Where shadow-mode disagreements are appended"
+    )
+    args = parser.parse_args()
+
+    prompt = args.prompt if args.prompt is not None else sys.stdin.read()
+    exit_code = 0
+    if args.compare:
+        verdict = detect_language(prompt, load_stopwords())
+        with open(args.compare, 'r', encoding='utf-8') as f_in:
+            run_shadow(prompt, f_in.read(), verdict, args.threshold, args.shadow_log)
+    elif is_confident_english(prompt, args.threshold, load_stopwords()):
+        print("\n".join(segment_tasks(prompt)))
+    else:
+        exit_code = EXIT_NEEDS_TRANSLATION
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Language Detector Shadow Mode (v0.1)
+
+Purpose:
+  Runs alongside the LLM translater and records every case where the local
+  detector and the translater disagree about the input being English, so the
+  bypass threshold can be tuned from real prompts.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return
+
+import os
+import re
+import sys
+import json
+import time
+import difflib
+from typing import Any, Dict, Tuple
+
+DEFAULT_SHADOW_LOG = "./tmp/rys.lang_shadow.jsonl"
+KEPT_RATIO = 0.8
+
+
+def llm_kept_text(source: str, translated: str) -> bool:
+    """True when the translater output is essentially the input (i.e. it was English)."""
+    src = re.findall(r"\w+", source.lower())
+    dst = re.findall(r"\w+", translated.lower())
+    return difflib.SequenceMatcher(None, src, dst).ratio() >= KEPT_RATIO
+
+
+def log_shadow(log_path: str, record: Dict[str, Any]) -> None:
+    """Appends a disagreement record to the shadow log."""
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    with open(log_path, 'a', encoding='utf-8') as f_out:
+        f_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return None
+
+
+def run_shadow(
+    prompt: str,
+    translated: str,
+    verdict: Tuple[str, float],
+    threshold: float,
+    log_path: str
+) -> None:
+    """Compares the local verdict with the LLM translater and logs disagreements."""
+    lang, confidence = verdict
+    local_english = lang == "en" and confidence >= threshold
+    llm_english = llm_kept_text(prompt, translated)
+
+    if local_english != llm_english:
+        log_shadow(log_path, {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "lang": lang,
+            "confidence": round(confidence, 3), "threshold": threshold,
+            "local_english": local_english, "llm_english": llm_english,
+            "prompt": prompt[:200],
+        })
+        sys.stderr.write(f"[lang shadow] disagreement logged to {log_path}\n")
+
+    return None
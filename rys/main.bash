@@ -6,44 +6,69 @@ set -e
 # --- Configuration & Environment Variables ---
 HOST="${RYS_LLM_HOST:-localhost}"
 PORT="${RYS_LLM_PORT:-11434}"
-MODEL="${RYS_LLM_MODEL:-gemma3n:e4b}"
+# auto: skip translater for English input / always / shadow: log detector disagreements
+TRANSLATE_MODE="${RYS_TRANSLATE_MODE:-auto}"
+# json | text: validate dispatcher/titler output, re-ask malformed lines
+STRUCT_OPTS="${RYS_STRUCTURED:+--structured=${RYS_STRUCTURED}}"
+# pass | warn: run a generated script per workflow audited [PASS] (or [WARN] too)
+EXECUTE="${RYS_EXECUTE:-}"
 
 # Define common options
-LLM_OPTS="--host=${HOST} --port=${PORT} --model=${MODEL}"
+LLM_OPTS="--host=${HOST} --port=${PORT}${RYS_LLM_MODEL:+ --model=${RYS_LLM_MODEL}}"
 
 rys_uuid=$(date +%Y%m%d_%H%M%S)
 
+# Usage is attributed to this run id and RYS_STAGE / RYS_REQUEST
+export RYS_RUN_ID="${rys_uuid}"
+export RYS_METRICS_FILE="${RYS_METRICS_FILE:-./tmp/.rys.${rys_uuid}.metrics.jsonl}"
+
 # Paths
 INVOKER="./rys/invoke_role.py"
 GROUPER="./rys/group_requests.py"
+DETECTOR="./rys/lang_detect.py"
 TEMP_TRANS="./tmp/.rys.${rys_uuid}.request.translated.txt"
 TEMP_DISP="./tmp/.rys.${rys_uuid}.request.dispatched.txt"
 TEMP_EXEC="./tmp/.rys.${rys_uuid}.exec_plan.tsv"
 TEMP_PLAN="./tmp/.rys.${rys_uuid}.request_plan.txt"
 TEMP_TITLES="./tmp/.rys.${rys_uuid}.titles.txt"
+TEMP_STEPS="./tmp/.rys.${rys_uuid}.steps.tsv"
+TEMP_INPUT="./tmp/.rys.${rys_uuid}.request.txt"
 RISKS_CONFIG="./config/risks.json"
 
-# Ensure prompt
-if [ -z "$1" ]; then
-    echo "Usage: $0 \"Your prompt here\""
+mkdir -p ./tmp/
+
+source ./rys/main_lib.bash
+
+# Prompt from the argument or stdin; stages read it from a file (no argv size limit)
+if ! save_prompt "${TEMP_INPUT}" "$1"; then
+    echo "Usage: $0 \"Your prompt here\" (or pipe it via stdin)"
     exit 1
 fi
 
 # --- Execution Flow ---
 
-mkdir -p ./tmp/
+# Usage summary + cleanup on every exit
+trap finish EXIT
 
 echo ">>> 1. Translation Phase"
-${INVOKER} ${LLM_OPTS} --role=translater --prompt="$1" | tee "${TEMP_TRANS}"
+if [ "${TRANSLATE_MODE}" = "auto" ] && ${DETECTOR} < "${TEMP_INPUT}" > "${TEMP_TRANS}"; then
+    echo "(English input detected locally: translater skipped)"
+    cat "${TEMP_TRANS}"
+else
+    RYS_STAGE=translation ${INVOKER} ${LLM_OPTS} --role=translater < "${TEMP_INPUT}" | tee "${TEMP_TRANS}"
+    if [ "${TRANSLATE_MODE}" = "shadow" ]; then
+        ${DETECTOR} --compare="${TEMP_TRANS}" < "${TEMP_INPUT}" || true
+    fi
+fi
 
 echo -e "\n>>> 2. Dispatch Phase"
-${INVOKER} ${LLM_OPTS} --role=dispatcher --skills --prompt="$(cat "${TEMP_TRANS}")" | tee "${TEMP_DISP}"
+RYS_STAGE=dispatch ${INVOKER} ${LLM_OPTS} ${STRUCT_OPTS} --role=dispatcher --skills < "${TEMP_TRANS}" | tee "${TEMP_DISP}"
 
 echo -e "\n>>> 3. Request Visualization Phase"
 # group_requests.py generates visualization on stdout AND writes execution plan to TEMP_EXEC
 if [ -f "${GROUPER}" ]; then
     VISUAL_INPUT=$(cat "${TEMP_DISP}" | "${GROUPER}" --plan-file="${TEMP_EXEC}")
-    echo "${VISUAL_INPUT}" | ${INVOKER} ${LLM_OPTS} --role=titler --prompt="${VISUAL_INPUT}" | tee "${TEMP_TITLES}"
+    echo "${VISUAL_INPUT}" | RYS_STAGE=titling ${INVOKER} ${LLM_OPTS} ${STRUCT_OPTS} --role=titler --prompt="${VISUAL_INPUT}" | tee "${TEMP_TITLES}"
 else
     echo "Warning: ${GROUPER} not found."
     cat "${TEMP_DISP}"
@@ -68,6 +93,7 @@ PROCESSED_JOBS=0
 while IFS=$'\t' read -r req_index current_skill topic || [ -n "$req_index" ]; do
     [ -z "$req_index" ] && continue
     ((PROCESSED_JOBS++))
+    export RYS_REQUEST="${req_index}"
 
     # Extract only the REQUEST title line for this index from TEMP_TITLES
     REQ_TITLE=$(grep "^REQUEST ${req_index}:" "${TEMP_TITLES}")
@@ -81,14 +107,14 @@ while IFS=$'\t' read -r req_index current_skill topic || [ -n "$req_index" ]; do
     combined_goal="- TOPIC: ${topic}"
 
     echo "  [Strategic Planning]"
-    PLAN_OUT=$(${INVOKER} ${LLM_OPTS} --role=planner --prompt="${combined_goal}" < /dev/null)
+    PLAN_OUT=$(RYS_STAGE=planning ${INVOKER} ${LLM_OPTS} --no-stream --role=planner --prompt="${combined_goal}" < /dev/null)
     # Force newline before numbers if the LLM returned a single line, then indent
     echo "${PLAN_OUT}" | sed 's/ \([0-9]\+\.\)/\n\1/g' | sed 's/^/  /'
     echo "${PLAN_OUT}" > "${TEMP_PLAN}"
 
     echo -e "\n  [Technical Analysis]"
     TEMP_ENG="./tmp/.rys.${rys_uuid}.engineer_out.txt"
-    ENG_OUT=$(${INVOKER} ${LLM_OPTS} --role=engineer --skills="${current_skill}" --prompt="${combined_goal}" < /dev/null)
+    ENG_OUT=$(RYS_STAGE=analysis ${INVOKER} ${LLM_OPTS} --no-stream --role=engineer --skills="${current_skill}" --prompt="${combined_goal}" < /dev/null)
     # Double indent (4 spaces total) for the content of Technical Analysis
     echo "${ENG_OUT}" | sed 's/^/    /'
     echo "${ENG_OUT}" > "${TEMP_ENG}"
@@ -96,15 +122,17 @@ while IFS=$'\t' read -r req_index current_skill topic || [ -n "$req_index" ]; do
     echo -e "\n  [Workflow Synthesis]"
     # Use the correct header "Technical Analysis" for the Refiner
     REFINER_INPUT="[Strategic Planning]\n$(cat "${TEMP_PLAN}")\n\n[Technical Analysis]\n$(cat "${TEMP_ENG}")"
-    REFINED_OUT=$(${INVOKER} ${LLM_OPTS} --role=refiner --skills="${current_skill}" --prompt="${REFINER_INPUT}" < /dev/null)
+    REFINED_OUT=$(RYS_STAGE=synthesis ${INVOKER} ${LLM_OPTS} --no-stream --role=refiner --skills="${current_skill}" --prompt="${REFINER_INPUT}" < /dev/null)
     echo "${REFINED_OUT}" | sed 's/ \([0-9]\+\.\)/\n\1/g' | sed 's/^/  /'
 
     echo -e "\n  [Audit & Verification]"
-    AUDIT_OUT=$(${INVOKER} ${LLM_OPTS} --role=auditor --risks="${RISKS_CONFIG}" --prompt="${REFINED_OUT}" < /dev/null)
+    AUDIT_OUT=$(RYS_STAGE=audit ${INVOKER} ${LLM_OPTS} --no-stream --role=auditor --risks="${RISKS_CONFIG}" --prompt="${REFINED_OUT}" < /dev/null)
     echo "${AUDIT_OUT}" | sed 's/^/  /'
 
     if echo "${AUDIT_OUT}" | grep -q "\[FAIL\]"; then
         echo -e "\n!!! AUDIT FAILED !!! Execution blocked for this topic."
+    elif audit_allows "${EXECUTE}" "${AUDIT_OUT}"; then
+        queue_step "${req_index}" "${current_skill}" "${REFINED_OUT}"
     fi
 
 done < "${TEMP_EXEC}"
@@ -112,4 +140,10 @@ done < "${TEMP_EXEC}"
 # Re-enable set -e
 set -e
 
-rm -f ./tmp/.rys.${rys_uuid}*
+# Failed, blocked or timed-out steps make the run exit non-zero (after the EXIT trap)
+EXEC_RC=0
+if [ -s "${TEMP_STEPS}" ]; then
+    echo -e "\n>>> 5. Execution Phase"
+    ./rys/exec_plan.py --mode="${EXECUTE}" --manifest="${TEMP_STEPS}" --record="./tmp/rys.${rys_uuid}.run.json" || EXEC_RC=$?
+fi
+exit "${EXEC_RC}"
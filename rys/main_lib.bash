@@ -0,0 +1,39 @@
+#!/usr/bin/env bash
+# Helper functions sourced by main.bash.
+
+# Usage summary + cleanup of this run's temporary files (EXIT trap)
+finish() {
+    if [ -s "${RYS_METRICS_FILE}" ]; then
+        echo -e "\n>>> Token Usage"
+        ./rys/token_report.py usage "${RYS_METRICS_FILE}" || true
+    fi
+    rm -f ./tmp/.rys.${rys_uuid}*
+}
+
+# audit_allows <pass|warn> <auditor output>
+# Succeeds only for an explicit verdict: [PASS] alone, or under 'warn' also [WARN].
+# [FAIL], error markers and answers without any verdict never allow execution.
+audit_allows() {
+    local verdict
+    verdict=$(echo "$2" | grep -o "\[PASS\]\|\[WARN\]\|\[FAIL\]\|Error\]" | LC_ALL=C sort -u | tr -d '\n')
+    [[ "$1:${verdict}" =~ ^(pass|warn):\[PASS\]$|^warn:(\[PASS\])?\[WARN\]$ ]]
+}
+
+# queue_step <request> <skill> <workflow>: has the coder write the step's script
+# and appends its row (index, skill, script file) to the step manifest.
+queue_step() {
+    local step_file="./tmp/.rys.${rys_uuid}.step${PROCESSED_JOBS}.txt"
+    RYS_STAGE=coding ${INVOKER} ${LLM_OPTS} --no-stream --role=coder --skills="$2" --prompt="$3" < /dev/null > "${step_file}"
+    printf '%s\t%s\t%s\n' "$1" "$2" "${step_file}" >> "${TEMP_STEPS}"
+}
+
+# save_prompt <file> [prompt]: writes the prompt argument, else piped stdin, to <file>.
+# Fails (and leaves no file) when there is no prompt.
+save_prompt() {
+    if [ -n "$2" ]; then
+        printf '%s\n' "$2" > "$1"
+    elif [ ! -t 0 ]; then
+        cat > "$1"
+    fi
+    [ -s "$1" ] || { rm -f "$1"; return 1; }
+}
@@ -1,82 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Role Loading and Prompt Construction Utilities (v0.2)
+Role Loading and Prompt Construction Utilities (v0.5)
 
 History:
   1. 2026-02-07 Initial version
   2. 2026-02-08 Added dynamic generation_policy injection (Code as Policy)
+  3. 2026-10-19 Prompt exposed as named sections; skill loading moved to skill_utils.py
+  4. 2026-10-19 Risk patterns as regexes for local screening (moved from candidate_score.py)
+  5. 2026-10-19 Risk patterns can be limited to some severities
 """
 # pylint: disable=useless-return
 
 import os
+import re
 import json
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Pattern, Tuple
 
-
-def load_file_content(filepath: str) -> str:
-    """Reads and returns content from a file."""
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"File not found: {filepath}")
-
-    with open(filepath, 'r', encoding='utf-8') as f_in:
-        content = f_in.read().strip()
-
-    return content
-
-
-def _get_skills_data(config_dir: str) -> str:
-    """Locates and reads skills.json or default_skills.json."""
-    skills_path = os.path.join(config_dir, "skills.json")
-    if not os.path.exists(skills_path):
-        skills_path = os.path.join(config_dir, "default_skills.json")
-    return load_file_content(skills_path)
-
-
-def _filter_skills_list(data: List[Dict[str, Any]], filter_ids: List[str]) -> List[Dict[str, Any]]:
-    """Helper to filter list of skill dicts."""
-    available_ids = {
-        item.get("id") for item in data
-        if isinstance(item, dict) and "id" in item
-    }
-    missing = [s for s in filter_ids if s not in available_ids]
-    if missing:
-        raise ValueError(f"Requested skills not found: {', '.join(missing)}")
-
-    return [item for item in data if isinstance(item, dict) and item.get("id") in filter_ids]
-
-
-def _filter_skills(data: Any, filter_ids: List[str]) -> Any:
-    """Filters skills data by ID."""
-    result = data
-
-    if isinstance(data, list):
-        result = _filter_skills_list(data, filter_ids)
-    elif isinstance(data, dict):
-        available_ids = set(data.keys())
-        missing = [s for s in filter_ids if s not in available_ids]
-        if missing:
-            raise ValueError(f"Requested skills not found: {', '.join(missing)}")
-        result = {k: v for k, v in data.items() if k in filter_ids}
-    else:
-        raise ValueError("skills.json has an unknown structure. Cannot filter.")
-
-    return result
-
-
-def load_skills_data(config_dir: str, filter_skills: Optional[List[str]]) -> Any:
-    """Loads skills as a Python object (List or Dict), filtering if requested."""
-    content = _get_skills_data(config_dir)
-    try:
-        data = json.loads(content)
-        if filter_skills is not None:
-            data = _filter_skills(data, filter_skills)
-    except json.JSONDecodeError as exc:
-        if filter_skills is not None:
-            raise ValueError("skills.json is invalid JSON. Cannot apply filter.") from exc
-        # Fallback to empty list or raise is better.
-        raise ValueError(f"skills.json is invalid JSON: {exc}") from exc
-    return data
+from skill_utils import load_file_content, load_skills_data
 
 
 def load_risks_content(risks_path: str) -> str:
@@ -89,25 +30,79 @@ def load_risks_content(risks_path: str) -> str:
     return content
 
 
-def construct_system_prompt(
+def load_risk_patterns(
+    risks_path: str, severities: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, Pattern[str]]]:
+    """(pattern, regex) per risks.json pattern, optionally only of the given severities.
+    '...' separates parts that must occur in order, parenthesised notes are dropped
+    and words only match as whole words."""
+    categories = [
+        c for c in json.loads(load_risks_content(risks_path)).get("risk_categories", [])
+        if severities is None or c.get("severity") in severities
+    ]
+    patterns = []
+    for pattern in (str(p) for c in categories for p in c.get("patterns", [])):
+        parts = [p.strip() for p in re.sub(r"\s*\(.*?\)", "", pattern).split("...")]
+        pieces = [
+            (r"\b" if part[0].isalnum() else "") + re.escape(part)
+            + (r"\b" if part[-1].isalnum() else "")
+            for part in parts if part
+        ]
+        if pieces:
+            patterns.append((pattern, re.compile(".*?".join(pieces), re.IGNORECASE | re.DOTALL)))
+    return patterns
+
+
+def matched_risks(text: str, patterns: List[Tuple[str, Pattern[str]]]) -> List[str]:
+    """The risk patterns found in the text."""
+    return [pattern for pattern, regex in patterns if regex.search(text)]
+
+
+def _skill_policy_sections(skills_data: Any) -> List[Tuple[str, str]]:
+    """Dynamic policy injection: one section per skill with a generation_policy."""
+    sections = []
+    # Normalize to list for iteration
+    skill_list = []
+    if isinstance(skills_data, list):
+        skill_list = skills_data
+    elif isinstance(skills_data, dict):
+        # If dict-based skills (id -> content), just take values
+        skill_list = list(skills_data.values())
+
+    for skill in skill_list:
+        if isinstance(skill, dict):
+            policy = skill.get("generation_policy")
+            if policy:
+                # Inject specific instructions for this skill
+                skill_id = skill.get('id', 'Unknown')
+                sections.append((
+                    f"policy:{skill_id}",
+                    f"\n# Specific Instructions for [{skill_id}]\n{policy}"
+                ))
+    return sections
+
+
+def build_prompt_sections(
     base_dir: str,
     role_name: str,
     skill_filter: Optional[List[str]],
     include_skills: bool,
     risks_file: Optional[str]
-) -> str:
-    """Combines role, constraints, skills, and risks into a system prompt."""
+) -> List[Tuple[str, str]]:
+    """Returns the system prompt as (section name, text) pairs, in order."""
     roles_dir = os.path.join(base_dir, "roles")
     config_dir = os.path.join(base_dir, "config")
-    parts = []
+    sections = []
 
     # 1. Base Role Definition
-    parts.append(load_file_content(os.path.join(roles_dir, f"role_{role_name}.md")))
+    sections.append(("role", load_file_content(os.path.join(roles_dir, f"role_{role_name}.md"))))
 
     # 2. Common Constraints
     common_file = os.path.join(roles_dir, "role_common_constraints.md")
     if os.path.exists(common_file):
-        parts.append("\n# Common Constraints\n" + load_file_content(common_file))
+        sections.append((
+            "common_constraints", "\n# Common Constraints\n" + load_file_content(common_file)
+        ))
 
     # 3. Skills & Policies
     if include_skills:
@@ -116,23 +111,8 @@ def construct_system_prompt(
 
         # Dump for the main skills block
         skills_text = json.dumps(skills_data, indent=2, ensure_ascii=False)
-        parts.append(f"\n# Available Skills definition\n```json\n{skills_text}\n```")
-
-        # Dynamic Policy Injection
-        # Normalize to list for iteration
-        skill_list = []
-        if isinstance(skills_data, list):
-            skill_list = skills_data
-        elif isinstance(skills_data, dict):
-            # If dict-based skills (id -> content), just take values
-            skill_list = list(skills_data.values())
-
-        for skill in skill_list:
-            if isinstance(skill, dict):
-                policy = skill.get("generation_policy")
-                if policy:
-                    # Inject specific instructions for this skill
-                    parts.append(f"\n# Specific Instructions for [{skill.get('id', 'Unknown')}]\n{policy}")
+        sections.append(("skills", f"\n# Available Skills definition\n```json\n{skills_text}\n```"))
+        sections.extend(_skill_policy_sections(skills_data))
 
     # 4. Risks
     if risks_file:
@@ -141,6 +121,18 @@ def construct_system_prompt(
             r_path = os.path.join(config_dir, "risks.json")
         if os.path.exists(r_path):
             r_text = load_risks_content(r_path)
-            parts.append(f"\n# Risk Knowledge Base\n```json\n{r_text}\n```")
+            sections.append(("risks", f"\n# Risk Knowledge Base\n```json\n{r_text}\n```"))
+
+    return sections
 
-    return "\n".join(parts)
+
+def construct_system_prompt(
+    base_dir: str,
+    role_name: str,
+    skill_filter: Optional[List[str]],
+    include_skills: bool,
+    risks_file: Optional[str]
+) -> str:
+    """Combines role, constraints, skills, and risks into a system prompt."""
+    sections = build_prompt_sections(base_dir, role_name, skill_filter, include_skills, risks_file)
+    return "\n".join(text for _, text in sections)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Skill Definition Loading Utilities (v0.1)
+
+History:
+  1. 2026-10-19 Initial version (split from role_utils.py)
+"""
+# pylint: disable=useless-return
+
+import os
+import json
+from typing import List, Optional, Any, Dict
+
+
+def load_file_content(filepath: str) -> str:
+    """Reads and returns content from a file."""
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    with open(filepath, 'r', encoding='utf-8') as f_in:
+        content = f_in.read().strip()
+
+    return content
+
+
+def _get_skills_data(config_dir: str) -> str:
+    """Locates and reads skills.json or default_skills.json."""
+    skills_path = os.path.join(config_dir, "skills.json")
+    if not os.path.exists(skills_path):
+        skills_path = os.path.join(config_dir, "default_skills.json")
+    return load_file_content(skills_path)
+
+
+def _filter_skills_list(data: List[Dict[str, Any]], filter_ids: List[str]) -> List[Dict[str, Any]]:
+    """Helper to filter list of skill dicts."""
+    available_ids = {
+        item.get("id") for item in data
+        if isinstance(item, dict) and "id" in item
+    }
+    missing = [s for s in filter_ids if s not in available_ids]
+    if missing:
+        raise ValueError(f"Requested skills not found: {', '.join(missing)}")
+
+    return [item for item in data if isinstance(item, dict) and item.get("id") in filter_ids]
+
+
+def _filter_skills(data: Any, filter_ids: List[str]) -> Any:
+    """Filters skills data by ID."""
+    result = data
+
+    if isinstance(data, list):
+        result = _filter_skills_list(data, filter_ids)
+    elif isinstance(data, dict):
+        available_ids = set(data.keys())
+        missing = [s for s in filter_ids if s not in available_ids]
+        if missing:
+            raise ValueError(f"Requested skills not found: {', '.join(missing)}")
+        result = {k: v for k, v in data.items() if k in filter_ids}
+    else:
+        raise ValueError("skills.json has an unknown structure. Cannot filter.")
+
+    return result
+
+
+def load_skills_data(config_dir: str, filter_skills: Optional[List[str]]) -> Any:
+    """Loads skills as a Python object (List or Dict), filtering if requested."""
+    content = _get_skills_data(config_dir)
+    try:
+        data = json.loads(content)
+        if filter_skills is not None:
+            data = _filter_skills(data, filter_skills)
+    except json.JSONDecodeError as exc:
+        if filter_skills is not None:
+            raise ValueError("skills.json is invalid JSON. Cannot apply filter.") from exc
+        # Fallback to empty list or raise is better.
+        raise ValueError(f"skills.json is invalid JSON: {exc}") from exc
+    return data
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Targeted Repair of Structured Role Answers (v0.2)
+
+Purpose:
+  Holds the Dispatcher/Titler answer as slots [text, error, key], builds the
+  short corrective prompt for the malformed slots only, merges the repaired
+  lines back and renders the canonical text for group_requests.py / main.bash.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 An answer without TOPIC lines is one malformed slot
+"""
+# pylint: disable=useless-return
+
+from typing import Any, Dict, List
+
+import structured_schema as schema
+
+TOPIC_FORMAT = (
+    "TOPIC: <Goal Description> | <Original Phrase> | SKILLS: <skill_id>\n"
+    "TOPIC: <Goal Description> | <Original Phrase> | IDONTKNOW: <Reason>"
+)
+
+
+def build_slots(role: str, lines: List[str], ctx: Any) -> List[List[Any]]:
+    """Slots are [text, error, key]; an empty error means the line is valid."""
+    slots = []
+    if role == "dispatcher":
+        slots = [[ln, schema.check_topic_line(ln, ctx), pos] for pos, ln in enumerate(lines)]
+        if not slots:
+            slots = [["", "no TOPIC lines in the answer", 0]]
+    else:
+        by_index: Dict[int, List[Any]] = {}
+        for ln in lines:
+            error = schema.check_title_line(ln, ctx)
+            match = schema.TITLE_RE.match(ln)
+            index = int(match["index"]) if match else -1
+            if index in ctx and (index not in by_index or by_index[index][1]):
+                by_index[index] = [ln, error, index]
+        slots = [by_index.get(i, [f"REQUEST {i}:", "missing title", i]) for i in sorted(ctx)]
+    return slots
+
+
+def repair_prompt(role: str, bad: List[List[Any]], ctx: Any) -> str:
+    """Short corrective prompt listing only the malformed lines."""
+    if role == "dispatcher" and not bad[0][0]:
+        prompt = (
+            "Your answer contained no TOPIC lines. Answer again, one line per goal, "
+            f"exactly as:\n{TOPIC_FORMAT}\nValid skill ids: {', '.join(ctx)}"
+        )
+    elif role == "dispatcher":
+        listing = "\n".join(f"- {s[0]}  (problem: {s[1]})" for s in bad)
+        prompt = (
+            "These lines of your answer are malformed. Rewrite ONLY them, in the same "
+            f"order, one per line, exactly as:\n{TOPIC_FORMAT}\n"
+            f"Valid skill ids: {', '.join(ctx)}\n\n{listing}"
+        )
+    else:
+        listing = "\n".join(f"REQUEST {s[2]}: {' '.join(ctx[s[2]])}" for s in bad)
+        prompt = (
+            "Give a 3-6 word title ONLY for these requests, one per line, exactly as "
+            f"'REQUEST <N>: <Title>' with no tags:\n\n{listing}"
+        )
+    return prompt
+
+
+def apply_repairs(role: str, slots: List[List[Any]], answer: str, ctx: Any) -> None:
+    """Replaces malformed slots with valid lines from the repair answer."""
+    bad = [s for s in slots if s[1]]
+    if role == "dispatcher" and not bad[0][0]:
+        valid = [
+            ln for ln in schema.topic_candidates(answer) if not schema.check_topic_line(ln, ctx)
+        ]
+        if valid:
+            bad[0][0], bad[0][1] = "\n".join(valid), ""
+    elif role == "dispatcher":
+        for slot, line in zip(bad, schema.topic_candidates(answer)):
+            if not schema.check_topic_line(line, ctx):
+                slot[0], slot[1] = line, ""
+    else:
+        for line in schema.title_candidates(answer):
+            match = schema.TITLE_RE.match(line)
+            for slot in bad:
+                same = match and int(match["index"]) == slot[2]
+                if same and not schema.check_title_line(line, ctx):
+                    slot[0], slot[1] = line, ""
+    return None
+
+
+def render(role: str, slots: List[List[Any]], ctx: Any) -> str:
+    """Canonical output; unrepaired lines are kept as they were."""
+    blocks = []
+    if role == "dispatcher":
+        blocks = [s[0] for s in slots if s[0]]
+    else:
+        for text, error, index in slots:
+            topic = ctx[index][0].removeprefix("- TOPIC: ") if ctx[index] else f"Request {index}"
+            title = f"REQUEST {index}: {topic[:40]}"
+            blocks.append("\n".join([title if error else text] + ctx[index]) + "\n")
+    return "\n".join(blocks)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structured Role Runner with Targeted Repair (v0.2)
+
+Purpose:
+  Runs the Dispatcher or Titler, validates every answer line strictly and
+  re-asks the model only for the malformed lines (RYS_REPAIR_ROUNDS, default
+  2) instead of rerunning the whole pipeline. The repair rate is reported on
+  stderr and to the metrics file. Lines that attempt the format (a TOPIC
+  tag or a '|') are validated; other chatter is ignored, but an answer with
+  no such line at all counts as malformed. Chunked Dispatcher output is
+  validated after the merge (chunked_role.py).
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Empty parses are malformed; validate_and_print()
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import argparse
+from typing import Any, Dict, List, Tuple
+
+import structured_schema as schema
+from chat_api import stream_chat_completion
+from chat_types import ChatConfig
+from chat_session import build_chat_config
+from chat_metrics import record_metric
+from chat_ui import TerminalColors
+from structured_repair import build_slots, repair_prompt, apply_repairs, render
+
+STRUCTURED_ROLES = ("dispatcher", "titler")
+
+
+def _first_answer(
+    role: str,
+    config: ChatConfig,
+    messages: List[Dict[str, str]],
+    mode: str
+) -> Tuple[str, List[str]]:
+    """Asks once (JSON Schema first when requested); returns (raw answer, candidate lines)."""
+    colors = TerminalColors(enable_color=False)
+    candidates = schema.topic_candidates if role == "dispatcher" else schema.title_candidates
+    lines = None
+    raw = ""
+    if mode == "json":
+        name, fmt, hint, from_json = (
+            ("dispatch", schema.DISPATCH_SCHEMA, schema.DISPATCH_JSON_HINT, schema.topics_from_json)
+            if role == "dispatcher" else
+            ("titles", schema.TITLE_SCHEMA, schema.TITLE_JSON_HINT, schema.titles_from_json)
+        )
+        json_messages = [dict(messages[0], content=f"{messages[0]['content']}\n\n{hint}")]
+        json_messages += messages[1:]
+        extra = {"response_format": schema.response_format(name, fmt)}
+        raw = "".join(stream_chat_completion(config, json_messages, colors, extra))
+        # A rejected response_format surfaces as a connection error: retry as plain text.
+        if "[Connection Error]" not in raw and "[Error]" not in raw:
+            try:
+                lines = from_json(raw.strip().strip("`").removeprefix("json"))
+            except (ValueError, AttributeError):
+                lines = candidates(raw)
+    if lines is None:
+        raw = "".join(stream_chat_completion(config, messages, colors))
+        lines = candidates(raw)
+    return raw, lines
+
+
+def validate_and_print(
+    args: argparse.Namespace,
+    config: ChatConfig,
+    history: List[Dict[str, str]],
+    lines: List[str],
+    ctx: Any
+) -> None:
+    """Validates the answer lines, re-asks after `history` for the malformed ones, prints."""
+    slots = build_slots(args.role, lines, ctx)
+    malformed = sum(1 for s in slots if s[1])
+
+    rounds = 0
+    colors = TerminalColors(enable_color=False)
+    while rounds < int(os.environ.get("RYS_REPAIR_ROUNDS", "2")) and any(s[1] for s in slots):
+        rounds += 1
+        bad = [s for s in slots if s[1]]
+        followup = history + [{"role": "user", "content": repair_prompt(args.role, bad, ctx)}]
+        answer = "".join(stream_chat_completion(config, followup, colors))
+        apply_repairs(args.role, slots, answer, ctx)
+
+    remaining = sum(1 for s in slots if s[1])
+    rate = malformed / len(slots) if slots else 0.0
+    sys.stderr.write(
+        f"[structured] {args.role}: {len(slots)} lines, {malformed} malformed "
+        f"({rate:.0%}), {malformed - remaining} repaired in {rounds} re-ask(s)\n"
+    )
+    record_metric(
+        "repair", role=args.role, mode=args.structured, lines=len(slots), malformed=malformed,
+        repaired=malformed - remaining, rounds=rounds, repair_rate=round(rate, 3)
+    )
+    print(render(args.role, slots, ctx))
+    return None
+
+
+def run_structured_role(args: argparse.Namespace, ctx: Any) -> None:
+    """Runs a structured role; ctx is the skill id list (dispatcher) or unused (titler)."""
+    config = build_chat_config(args)
+    if args.role == "titler":
+        ctx = schema.expected_requests(args.prompt)
+    messages = [
+        {"role": "system", "content": args.system},
+        {"role": "user", "content": args.prompt},
+    ]
+    raw, lines = _first_answer(args.role, config, messages, args.structured)
+    history = messages + [{"role": "assistant", "content": raw}]
+    validate_and_print(args, config, history, lines, ctx)
+    return None
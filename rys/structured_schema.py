@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structured Output Schemas and Validators (v0.1)
+
+Purpose:
+  JSON Schemas (for backends that honour `response_format`) and strict local
+  validators for the Dispatcher and Titler line formats. JSON answers are
+  converted to the canonical text lines first, so both modes share one
+  validator and group_requests.py keeps reading the same format.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return
+
+import re
+import json
+from typing import Any, Dict, List
+
+TOPIC_RE = re.compile(
+    r"^TOPIC:\s*(?P<goal>[^|]*?)\s*\|\s*(?P<phrase>[^|]*?)\s*\|\s*"
+    r"(?P<status>SKILLS|IDONTKNOW):\s*(?P<value>[^|]*?)\s*$"
+)
+TITLE_RE = re.compile(r"^REQUEST\s+(?P<index>\d+)\s*:\s*(?P<title>.*?)\s*$")
+HEADER_RE = re.compile(r"^REQUEST\s+(?P<index>\d+)\s*\[")
+
+DISPATCH_SCHEMA = {
+    "type": "object",
+    "properties": {"topics": {"type": "array", "items": {
+        "type": "object",
+        "properties": {
+            "goal": {"type": "string"},
+            "phrase": {"type": "string"},
+            "status": {"type": "string", "enum": ["SKILLS", "IDONTKNOW"]},
+            "value": {"type": "string"},
+        },
+        "required": ["goal", "phrase", "status", "value"],
+        "additionalProperties": False,
+    }}},
+    "required": ["topics"],
+    "additionalProperties": False,
+}
+
+TITLE_SCHEMA = {
+    "type": "object",
+    "properties": {"requests": {"type": "array", "items": {
+        "type": "object",
+        "properties": {"index": {"type": "integer"}, "title": {"type": "string"}},
+        "required": ["index", "title"],
+        "additionalProperties": False,
+    }}},
+    "required": ["requests"],
+    "additionalProperties": False,
+}
+
+DISPATCH_JSON_HINT = (
+    'Respond ONLY with JSON: {"topics": [{"goal": "<Goal Description>", '
+    '"phrase": "<Original Phrase>", "status": "SKILLS" or "IDONTKNOW", '
+    '"value": "<skill_id or reason>"}]}'
+)
+TITLE_JSON_HINT = 'Respond ONLY with JSON: {"requests": [{"index": <N>, "title": "<Title>"}]}'
+
+
+def response_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds an OpenAI-style `response_format` request field."""
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+
+def check_topic_line(line: str, skill_ids: List[str]) -> str:
+    """Returns an error description, or an empty string if the line is valid."""
+    error = ""
+    match = TOPIC_RE.match(line.strip())
+    if not match:
+        error = "expected 'TOPIC: <goal> | <phrase> | SKILLS: <id>' or '... | IDONTKNOW: <reason>'"
+    elif not match["goal"] or not match["phrase"]:
+        error = "goal and phrase must not be empty"
+    elif not match["value"]:
+        error = f"missing value after {match['status']}:"
+    elif match["status"] == "SKILLS" and match["value"] not in skill_ids:
+        error = f"unknown skill id '{match['value']}' (valid: {', '.join(skill_ids)})"
+    return error
+
+
+def topic_candidates(text: str) -> List[str]:
+    """Lines of a text answer that are meant to be TOPIC lines."""
+    return [
+        ln.strip() for ln in text.splitlines()
+        if ln.strip().upper().startswith("TOPIC") or "|" in ln
+    ]
+
+
+def topics_from_json(text: str) -> List[str]:
+    """Converts a JSON answer to TOPIC lines (raises ValueError if not JSON)."""
+    data = json.loads(text)
+    items = data.get("topics", []) if isinstance(data, dict) else []
+    lines = []
+    for item in items:
+        if isinstance(item, dict):
+            lines.append(
+                f"TOPIC: {item.get('goal', '')} | {item.get('phrase', '')} | "
+                f"{item.get('status', '')}: {item.get('value', '')}"
+            )
+        else:
+            lines.append(str(item))
+    return lines
+
+
+def expected_requests(prompt: str) -> Dict[int, List[str]]:
+    """Maps REQUEST index to its '- TOPIC:' lines from the grouped Titler input."""
+    blocks: Dict[int, List[str]] = {}
+    current = None
+    for line in prompt.splitlines():
+        header = HEADER_RE.match(line.strip())
+        if header:
+            current = int(header["index"])
+            blocks[current] = []
+        elif current is not None and line.strip().startswith("- TOPIC:"):
+            blocks[current].append(line.strip())
+    return blocks
+
+
+def check_title_line(line: str, expected: Dict[int, List[str]]) -> str:
+    """Returns an error description, or an empty string if the title line is valid."""
+    error = ""
+    match = TITLE_RE.match(line.strip())
+    if not match:
+        error = "expected 'REQUEST <N>: <Title>'"
+    elif int(match["index"]) not in expected:
+        error = f"no REQUEST {match['index']} in the input"
+    elif not match["title"] or "[" in match["title"]:
+        error = "title must be plain text without [Skill]/[Status] tags"
+    return error
+
+
+def title_candidates(text: str) -> List[str]:
+    """Lines of a text answer that are meant to be REQUEST title lines."""
+    return [ln.strip() for ln in text.splitlines() if ln.strip().upper().startswith("REQUEST")]
+
+
+def titles_from_json(text: str) -> List[str]:
+    """Converts a JSON answer to title lines (raises ValueError if not JSON)."""
+    data = json.loads(text)
+    items = data.get("requests", []) if isinstance(data, dict) else []
+    return [
+        f"REQUEST {item.get('index', '?')}: {item.get('title', '')}"
+        if isinstance(item, dict) else str(item)
+        for item in items
+    ]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Input Chunking and TOPIC Merging for Long Inputs (v0.1)
+
+Purpose:
+  split_chunks() cuts a long input into chunks within a token budget,
+  preferring paragraph, then sentence boundaries; a single sentence larger
+  than the budget is cut hard. The split keeps input order and loses
+  nothing but whitespace-only chunks.
+
+  merge_topics() concatenates per-chunk Dispatcher answers in chunk order
+  and drops repeated TOPIC lines (same goal and skill/status), keeping the
+  first occurrence, so group_requests numbers REQUESTs in input order.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return
+
+import re
+from typing import Iterator, List
+
+from structured_schema import TOPIC_RE, topic_candidates
+from token_usage import estimate_tokens
+
+PARAGRAPH_RE = re.compile(r".*?(?:\n[ \t]*\n\s*|\Z)", re.DOTALL)
+SENTENCE_RE = re.compile(r".*?(?:[.!?]+[\"')\]]*\s+|[。！？]\s*|\n|\Z)", re.DOTALL)
+
+
+def _hard_split(text: str, budget: int) -> Iterator[str]:
+    """Cuts text into pieces of at most `budget` estimated tokens."""
+    start, used = 0, 0.0
+    for pos, char in enumerate(text):
+        cost = 0.25 if char.isascii() else 1.0
+        if pos > start and used + cost > budget:
+            yield text[start:pos]
+            start, used = pos, 0.0
+        used += cost
+    if start < len(text):
+        yield text[start:]
+    return None
+
+
+def _pieces(text: str, budget: int) -> Iterator[str]:
+    """Paragraphs, or the sentences of paragraphs that exceed the budget."""
+    for paragraph in PARAGRAPH_RE.findall(text):
+        if estimate_tokens(paragraph) <= budget:
+            yield paragraph
+        else:
+            for sentence in SENTENCE_RE.findall(paragraph):
+                if estimate_tokens(sentence) <= budget:
+                    yield sentence
+                else:
+                    yield from _hard_split(sentence, budget)
+    return None
+
+
+def split_chunks(text: str, budget: int) -> List[str]:
+    """Packs consecutive pieces greedily into chunks of at most `budget` tokens."""
+    chunks: List[str] = []
+    current, used = "", 0
+    for piece in _pieces(text, max(budget, 1)):
+        cost = estimate_tokens(piece)
+        if current and used + cost > budget:
+            chunks.append(current)
+            current, used = "", 0
+        current += piece
+        used += cost
+    if current:
+        chunks.append(current)
+    return [c for c in chunks if c.strip()]
+
+
+def topic_key(line: str) -> str:
+    """Dedupe key: normalized goal plus SKILLS/IDONTKNOW value."""
+    match = TOPIC_RE.match(line)
+    key = " ".join(line.lower().split())
+    if match:
+        goal = " ".join(match["goal"].lower().split())
+        key = f"{goal}|{match['status']}|{match['value'].strip().lower()}"
+    return key
+
+
+def merge_topics(answers: List[str]) -> List[str]:
+    """TOPIC lines of all answers in order, first occurrence of each kept."""
+    seen = set()
+    merged = []
+    for answer in answers:
+        for line in topic_candidates(answer):
+            key = topic_key(line)
+            if key not in seen:
+                seen.add(key)
+                merged.append(line)
+    return merged
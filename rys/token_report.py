@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token Usage Report (v0.2)
+
+Usage:
+  token_report.py usage METRICS_FILE [--by role,stage,request]
+      Sums prompt/completion tokens and average latency from 'usage' metrics
+      events (e.g. --by role,model to compare routed models).
+  token_report.py prompt [--role NAME]
+      Breaks each role's system prompt down by section (role text, common
+      constraints, skills, per-skill policies, risks), as main.bash builds it.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Average call latency column
+"""
+# pylint: disable=useless-return
+
+import os
+import sys
+import json
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+from role_utils import build_prompt_sections
+from skill_utils import load_skills_data
+from token_usage import estimate_tokens
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(SCRIPT_DIR)
+RISKS_FILE = os.path.join(BASE_DIR, "config", "risks.json")
+
+# role -> (include_skills, one call per skill, risks file), mirroring main.bash
+PIPELINE_PROFILE = {
+    "translater": (False, False, None),
+    "dispatcher": (True, False, None),
+    "titler": (False, False, None),
+    "planner": (False, False, None),
+    "engineer": (True, True, None),
+    "refiner": (True, True, None),
+    "auditor": (False, False, RISKS_FILE),
+    "coder": (True, True, None),
+}
+
+
+def report_usage(path: str, keys: List[str]) -> None:
+    """Prints token totals grouped by the given attribution keys."""
+    totals: Dict[Tuple[str, ...], List[float]] = {}
+    with open(path, 'r', encoding='utf-8') as f_in:
+        for line in f_in:
+            record = json.loads(line) if line.strip() else {}
+            if record.get("event") == "usage":
+                group = tuple(str(record.get(k, "")) or "-" for k in keys)
+                row = totals.setdefault(group, [0, 0, 0, 0, 0.0, 0])
+                row[0] += 1
+                row[1] += record.get("prompt_tokens", 0)
+                row[2] += record.get("completion_tokens", 0)
+                row[3] += record.get("source") == "estimate"
+                if record.get("latency_ms") is not None:
+                    row[4] += record["latency_ms"]
+                    row[5] += 1
+
+    header = "".join(f"{k:<14}" for k in keys)
+    print(f"{header}{'calls':>6} {'prompt':>9} {'completion':>11} {'estimated':>10} {'avg_ms':>9}")
+    for group, row in sorted(totals.items()):
+        cells = "".join(f"{g[:13]:<14}" for g in group)
+        avg = f"{row[4] / row[5]:.0f}" if row[5] else "-"
+        print(f"{cells}{row[0]:>6} {row[1]:>9} {row[2]:>11} {row[3]:>10} {avg:>9}")
+    return None
+
+
+def _print_sections(label: str, sections: List[Tuple[str, str]]) -> None:
+    """Prints one role's section table."""
+    total = sum(estimate_tokens(text) for _, text in sections) or 1
+    print(f"\n[{label}] ~{total} tokens")
+    for name, text in sections:
+        tokens = estimate_tokens(text)
+        print(f"  {name:<28}{len(text):>7} chars {tokens:>6} tok {tokens / total:>6.1%}")
+    return None
+
+
+def report_prompts(only_role: Optional[str]) -> None:
+    """Prints the per-section breakdown of each role's system prompt."""
+    skills = load_skills_data(os.path.join(BASE_DIR, "config"), None)
+    skill_ids = [s.get("id") for s in skills] if isinstance(skills, list) else list(skills)
+
+    for role, (include_skills, per_skill, risks) in PIPELINE_PROFILE.items():
+        if only_role in (None, role):
+            variants = [[sid] for sid in skill_ids] if per_skill else [None]
+            for skill_filter in variants:
+                label = f"{role}:{skill_filter[0]}" if skill_filter else role
+                _print_sections(label, build_prompt_sections(
+                    BASE_DIR, role, skill_filter, include_skills, risks
+                ))
+    return None
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Token Usage Report")
+    sub = parser.add_subparsers(dest="command", required=True)
+    usage_cmd = sub.add_parser("usage", help="Totals from a metrics file")
+    usage_cmd.add_argument("metrics_file")
+    usage_cmd.add_argument("--by", default="role,stage,request", help="Comma-separated keys")
+    prompt_cmd = sub.add_parser("prompt", help="System prompt breakdown by section")
+    prompt_cmd.add_argument("--role", help="Only this role")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "usage":
+            report_usage(args.metrics_file, [k.strip() for k in args.by.split(",") if k.strip()])
+        else:
+            report_prompts(args.role)
+    except (OSError, ValueError) as exc:
+        sys.stderr.write(f"Error: {exc}\n")
+        sys.exit(1)
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token Usage Accounting (v0.3)
+
+Purpose:
+  Records prompt/completion tokens for every completion as a 'usage' metric,
+  attributed to role (ChatConfig.role), stage (RYS_STAGE), request
+  (RYS_REQUEST) and run (RYS_RUN_ID). Backend-reported usage is preferred;
+  a local estimate is used when the backend does not report it.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Entries carry the serving endpoint and the call latency
+  3. 2026-10-19 Model load time reported by the Ollama backend
+"""
+# pylint: disable=useless-return
+
+import os
+from urllib.parse import urlsplit
+from typing import Any, Dict, List, Optional
+
+from chat_metrics import record_metric
+from chat_types import ChatConfig
+
+MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: ~4 ASCII chars per token, 1 token per other char."""
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def estimate_prompt_tokens(messages: List[Dict[str, str]]) -> int:
+    """Estimated prompt tokens including per-message template overhead."""
+    return sum(estimate_tokens(str(m.get("content", ""))) + MESSAGE_OVERHEAD for m in messages)
+
+
+def account_usage(
+    config: ChatConfig,
+    messages: List[Dict[str, str]],
+    completion: str,
+    usage: Dict[str, Any],
+    elapsed_s: Optional[float] = None
+) -> Dict[str, Any]:
+    """Records and returns the usage entry for one completion."""
+    reported = "prompt_tokens" in usage and "completion_tokens" in usage
+    entry = {
+        "run": os.environ.get("RYS_RUN_ID", ""),
+        "role": config.role or "-",
+        "stage": os.environ.get("RYS_STAGE", ""),
+        "request": os.environ.get("RYS_REQUEST", ""),
+        "model": config.model,
+        "endpoint": urlsplit(config.api_url).netloc,
+        "prompt_tokens": int(usage["prompt_tokens"]) if reported
+        else estimate_prompt_tokens(messages),
+        "completion_tokens": int(usage["completion_tokens"]) if reported
+        else estimate_tokens(completion),
+        "source": "backend" if reported else "estimate",
+        "latency_ms": round(elapsed_s * 1000, 1) if elapsed_s is not None else None,
+        "load_ms": usage.get("load_ms"),
+    }
+    record_metric("usage", **entry)
+    return entry
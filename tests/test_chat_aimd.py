@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adaptive In-flight Limit Tests (v0.1)
+
+Purpose:
+  Drives the stand-in server with RYS_SCHED_LIMIT=auto and checks that only
+  requests which really queued raise the limit. Run with
+  `python -m pytest tests` or `python -m unittest discover tests`.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return,wrong-import-position
+
+import os
+import sys
+import json
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT_DIR, "rys"), os.path.join(ROOT_DIR, "tools")]
+
+from chat_aimd import current_limit
+from chat_api import stream_chat_completion
+from chat_sched import _endpoint_key
+from chat_slots import HAS_FCNTL, try_slots
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from stub_server import StubSettings, build_server
+
+
+@unittest.skipUnless(HAS_FCNTL, "the scheduler needs fcntl")
+class AdaptiveLimitTest(unittest.TestCase):
+    """Sequential clients against an idle stand-in server."""
+
+    def setUp(self) -> None:
+        self.work = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.metrics = os.path.join(self.work.name, "metrics.jsonl")
+        self.env = mock.patch.dict(os.environ, {
+            "RYS_SCHED_LIMIT": "auto", "RYS_SCHED_DIR": self.work.name,
+            "RYS_SCHED_RESERVE": "0", "RYS_METRICS_FILE": self.metrics,
+        })
+        self.env.start()
+        self.server = build_server(0, StubSettings(tokens=8))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        port = self.server.server_address[1]
+        self.config = ChatConfig(
+            api_url=f"http://127.0.0.1:{port}/v1/chat/completions",
+            model="stub", quiet_mode=True, stream_output=True, priority="batch"
+        )
+        return None
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.env.stop()
+        self.work.cleanup()
+        return None
+
+    def _ask(self, count: int) -> None:
+        messages = [{"role": "user", "content": "Summarize the open tickets."}]
+        for _ in range(count):
+            for _chunk in stream_chat_completion(self.config, messages, TerminalColors(False)):
+                pass
+        return None
+
+    def _events(self, name: str) -> list:
+        with open(self.metrics, 'r', encoding='utf-8') as f_in:
+            events = [json.loads(line) for line in f_in]
+        return [e for e in events if e.get("event") == name]
+
+    def test_uncontended_client_keeps_the_limit(self) -> None:
+        """A lone sequential client never waits, so the limit must not grow."""
+        self._ask(10)
+        decisions = self._events("aimd")
+        self.assertEqual(len(decisions), 10)
+        self.assertEqual({d["decision"] for d in decisions}, {"hold"})
+        self.assertEqual({d["wait_ms"] for d in decisions}, {0.0})
+        self.assertEqual(current_limit(self.work.name, _endpoint_key(self.config.api_url)), 2)
+        return None
+
+    def test_queued_request_raises_the_limit(self) -> None:
+        """A request that found its slot taken counts as queued and may grow the limit."""
+        key = _endpoint_key(self.config.api_url)
+        with mock.patch.dict(os.environ, {"RYS_SCHED_MAX": "1"}):
+            held = try_slots(self.work.name, key, range(1))
+            threading.Timer(0.2, os.close, args=(held,)).start()
+            self._ask(1)
+        waits = self._events("queue_wait")
+        self.assertEqual([w["queued"] for w in waits], [True])
+        self.assertGreaterEqual(waits[0]["wait_ms"], 150.0)
+        self.assertEqual([d["decision"] for d in self._events("aimd")], ["increase"])
+        return None
+
+
+if __name__ == "__main__":
+    unittest.main()
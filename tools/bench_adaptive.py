@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Fixed vs Adaptive In-flight Limits (v0.1)
+
+Purpose:
+  Drives the stand-in server (serving --capacity requests at a time) with
+  --workers concurrent streaming clients for --seconds per scheduler setting
+  and prints throughput, end-to-end TTFT percentiles and, for
+  RYS_SCHED_LIMIT=auto, the limit the controller settled on and its
+  decisions (from the 'aimd' metrics).
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return,wrong-import-position
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+from typing import Dict, List
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(TOOLS_DIR), "rys"))
+
+from chat_api import stream_chat_completion
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from stub_server import StubSettings, build_server
+
+
+def _client(config: ChatConfig, deadline: float, ttfts: List[float]) -> None:
+    """Sends completions back to back until the deadline."""
+    colors = TerminalColors(enable_color=False)
+    messages = [{"role": "user", "content": "Summarize the open tickets. " * 30}]
+    while time.monotonic() < deadline:
+        started, first = time.monotonic(), None
+        for _ in stream_chat_completion(config, messages, colors):
+            first = first or time.monotonic()
+        ttfts.append((first or time.monotonic()) - started)
+    return None
+
+
+def _decisions(metrics_file: str) -> Dict[str, float]:
+    """Counts 'aimd' decisions and returns the last limit."""
+    summary: Dict[str, float] = {}
+    with open(metrics_file, 'r', encoding='utf-8') as f_in:
+        for line in f_in:
+            event = json.loads(line)
+            if event.get("event") == "aimd":
+                summary[event["decision"]] = summary.get(event["decision"], 0) + 1
+                summary["limit"] = event["limit"]
+    return summary
+
+
+def _run(config: ChatConfig, limit: str, args: argparse.Namespace) -> None:
+    """One row of the table."""
+    with tempfile.TemporaryDirectory() as work:
+        metrics = os.path.join(work, "metrics.jsonl")
+        with open(metrics, 'a', encoding='utf-8'):
+            pass
+        os.environ.update({
+            "RYS_SCHED_LIMIT": limit, "RYS_SCHED_DIR": work, "RYS_METRICS_FILE": metrics,
+            "RYS_SCHED_RESERVE": "0", "RYS_SCHED_MAX": str(args.workers),
+        })
+        ttfts: List[float] = []
+        started = time.monotonic()
+        deadline = started + args.seconds
+        workers = [threading.Thread(target=_client, args=(config, deadline, ttfts))
+                   for _ in range(args.workers)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.monotonic() - started
+        ttfts.sort()
+        summary = _decisions(metrics)
+
+    p50 = ttfts[len(ttfts) // 2] * 1000 if ttfts else 0.0
+    p95 = ttfts[int(len(ttfts) * 0.95)] * 1000 if ttfts else 0.0
+    decisions = " ".join(f"{k}={int(v)}" for k, v in sorted(summary.items()) if k != "limit")
+    print(f"{limit:>6} {len(ttfts) / elapsed:>8.1f} {p50:>8.0f} {p95:>8.0f} "
+          f"{summary.get('limit', '-'):>6}  {decisions}")
+    return None
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Fixed vs adaptive in-flight limit")
+    parser.add_argument("--port", type=int, default=18096)
+    parser.add_argument("--capacity", type=int, default=4, help="Server concurrent requests")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--limits", nargs="+", default=["1", "16", "auto"])
+    args = parser.parse_args()
+
+    config = ChatConfig(
+        api_url=f"http://127.0.0.1:{args.port}/v1/chat/completions",
+        model="stub", quiet_mode=True, stream_output=True, priority="batch"
+    )
+    settings = StubSettings(tokens=30, token_delay=0.01, prefill_ms_per_kchar=100.0,
+                            capacity=args.capacity)
+    with build_server(args.port, settings) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"{'limit':>6} {'req/s':>8} {'p50_ms':>8} {'p95_ms':>8} {'final':>6}  decisions")
+        for limit in args.limits:
+            _run(config, limit, args)
+        server.shutdown()
+    return None
+
+
+if __name__ == "__main__":
+    main()
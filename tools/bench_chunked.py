@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Single-prompt vs Chunked (Map-reduce) Long Inputs (v0.1)
+
+Purpose:
+  Sends synthetic documents of 10k-100k characters to the stand-in server
+  once as a single prompt and once split by text_chunks.split_chunks(),
+  sequentially and in parallel (chunked_role.map_chunks). The server charges
+  linear plus quadratic prompt processing, serves --slots requests at a
+  time and rejects prompts beyond --context-chars, like a small local model.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return,wrong-import-position
+
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(TOOLS_DIR), "rys"))
+
+from chat_oneshot import complete_chat
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from chunked_role import map_chunks
+from text_chunks import split_chunks
+from stub_server import StubSettings, build_server
+
+WORDS = ("find the largest file in the project and list every python script then "
+         "check the weather for tomorrow and summarize the open tickets").split()
+
+
+def make_document(chars: int, seed: int = 7) -> str:
+    """Paragraphs of random sentences, about `chars` characters long."""
+    rng = random.Random(seed)
+    paragraphs, size = [], 0
+    while size < chars:
+        sentences = [
+            " ".join(rng.choices(WORDS, k=rng.randint(6, 18))).capitalize() + rng.choice(".!?")
+            for _ in range(rng.randint(2, 7))
+        ]
+        paragraphs.append(" ".join(sentences))
+        size += len(paragraphs[-1]) + 2
+    return "\n\n".join(paragraphs)[:chars]
+
+
+def _timed_ms(func, *args) -> str:
+    """Wall time of func(*args) in ms, or 'ctx!' when the server rejected a prompt."""
+    started = time.perf_counter()
+    answers = func(*args)
+    failed = any("[Connection Error]" in a for a in answers)
+    return "ctx!" if failed else f"{(time.perf_counter() - started) * 1000:.0f}"
+
+
+def _compare(config: ChatConfig, args: argparse.Namespace) -> None:
+    """Prints one table row per document size."""
+    colors = TerminalColors(enable_color=False)
+    system = "Translate the following text into English."
+
+    def single(text: str) -> list:
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": text}]
+        return [complete_chat(config, messages, colors)["content"]]
+
+    print(f"{'chars':>8} {'chunks':>7} {'single_ms':>10} {'chunked_1_ms':>13} "
+          f"{'chunked_' + str(args.slots) + '_ms':>13}")
+    for chars in args.chars:
+        text = make_document(chars)
+        chunks = split_chunks(text, args.budget)
+        print(f"{chars:>8} {len(chunks):>7} {_timed_ms(single, text):>10} "
+              f"{_timed_ms(map_chunks, config, system, chunks, 1):>13} "
+              f"{_timed_ms(map_chunks, config, system, chunks, args.slots):>13}")
+    return None
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Single vs chunked long-input benchmark")
+    parser.add_argument("--port", type=int, default=18094)
+    parser.add_argument("--chars", type=int, nargs="+", default=[10000, 25000, 50000, 100000])
+    parser.add_argument("--budget", type=int, default=1500, help="Tokens per chunk")
+    parser.add_argument("--slots", type=int, default=4, help="Server parallel slots = jobs")
+    parser.add_argument("--ms-per-kchar", type=float, default=20.0)
+    parser.add_argument("--ms-per-kchar2", type=float, default=2.0)
+    parser.add_argument("--context-chars", type=int, default=64000)
+    args = parser.parse_args()
+
+    config = ChatConfig(
+        api_url=f"http://127.0.0.1:{args.port}/v1/chat/completions",
+        model="stub", quiet_mode=True, stream_output=False
+    )
+    with build_server(args.port, StubSettings(
+        tokens=16, capacity=args.slots, prefill_ms_per_kchar=args.ms_per_kchar,
+        prefill_ms_per_kchar2=args.ms_per_kchar2, context_chars=args.context_chars
+    )) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        _compare(config, args)
+        server.shutdown()
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: SSE Streaming vs Non-streaming Completions (v0.1)
+
+Purpose:
+  Runs the same long completion through stream_chat_completion and
+  complete_chat against the local stand-in server and prints the mean
+  client-side wall time of each path.
+
+History:
+  1. 2026-10-19 Initial version
+"""
+# pylint: disable=useless-return,wrong-import-position
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(TOOLS_DIR), "rys"))
+
+from chat_api import stream_chat_completion
+from chat_oneshot import complete_chat
+from chat_types import ChatConfig
+from chat_ui import TerminalColors
+from stub_server import StubSettings, build_server
+
+
+def _timed(func, repeat: int) -> float:
+    """Mean wall time of func() in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="SSE vs non-streaming benchmark")
+    parser.add_argument("--port", type=int, default=18090)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tokens", type=int, nargs="+", default=[500, 2000, 8000])
+    args = parser.parse_args()
+
+    colors = TerminalColors(enable_color=False)
+    messages = [{"role": "user", "content": "Write a long answer."}]
+    config = ChatConfig(
+        api_url=f"http://127.0.0.1:{args.port}/v1/chat/completions",
+        model="stub", quiet_mode=True, stream_output=False
+    )
+
+    print(f"{'tokens':>8} {'sse_ms':>10} {'oneshot_ms':>12} {'speedup':>8}")
+    for count in args.tokens:
+        server = build_server(args.port, StubSettings(tokens=count))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        sse = _timed(lambda: "".join(stream_chat_completion(config, messages, colors)), args.repeat)
+        one = _timed(lambda: complete_chat(config, messages, colors)["content"], args.repeat)
+        print(f"{count:>8} {sse:>10.1f} {one:>12.1f} {sse / one:>7.1f}x")
+        server.shutdown()
+        server.server_close()
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stand-in Model Behaviour (v0.2)
+
+Purpose:
+  Settings, prompt accounting and an optional one-slot prefix cache shared
+  by the stand-in servers in this directory. Prompt processing costs a
+  linear plus a quadratic (attention-like) term per thousand characters.
+  ModelResidency models Ollama's loaded model: a request pays the load time
+  when nothing is resident, keep_alive expired or num_ctx changed.
+
+History:
+  1. 2026-10-19 Initial version (split from stub_server.py)
+  2. 2026-10-19 Quadratic prefill term and a context window
+  3. 2026-10-19 Model residency (moved from stub_ollama.py)
+"""
+# pylint: disable=useless-return
+
+import re
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+DURATION_RE = re.compile(r"^(-?\d+(?:\.\d+)?)([smh]?)$")
+
+
+@dataclass
+class StubSettings:
+    """Behaviour of the stand-in server."""
+    tokens: int = 64
+    token_delay: float = 0.0
+    prefill_ms_per_kchar: float = 0.0
+    capacity: int = 0
+    kv_cache: bool = False
+    prefill_ms_per_kchar2: float = 0.0
+    context_chars: int = 0
+
+
+def prompt_chars(body: Dict[str, Any]) -> int:
+    """Total characters of all message contents."""
+    return sum(len(str(m.get("content", ""))) for m in body.get("messages", []))
+
+
+def usage_block(body: Dict[str, Any], completion_tokens: int) -> Dict[str, int]:
+    """OpenAI-style usage block (prompt tokens estimated as chars / 4)."""
+    prompt_tokens = prompt_chars(body) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def uncached_chars(body: Dict[str, Any], cached: List[str], enabled: bool) -> int:
+    """Characters needing prompt processing when the previous prompt's leading
+    messages are reused, like a single llama.cpp slot; `cached` is updated in place."""
+    contents = [str(m.get("content", "")) for m in body.get("messages", [])]
+    hits = 0
+    while enabled and hits < min(len(contents), len(cached)) and contents[hits] == cached[hits]:
+        hits += 1
+    cached[:] = contents
+    return sum(len(c) for c in contents[hits:])
+
+
+def prefill_seconds(chars: int, settings: StubSettings) -> float:
+    """Simulated prompt processing time for `chars` uncached characters."""
+    kchars = chars / 1000
+    linear = kchars * settings.prefill_ms_per_kchar
+    return (linear + kchars ** 2 * settings.prefill_ms_per_kchar2) / 1000
+
+
+def keep_alive_seconds(value: Any) -> float:
+    """Seconds for keep_alive values such as 300, "30m", "10s" or -1 (forever)."""
+    match = DURATION_RE.match(str(value if value is not None else "5m").strip())
+    seconds = 300.0
+    if match:
+        seconds = float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600}[match.group(2)]
+    return float("inf") if seconds < 0 else seconds
+
+
+class ModelResidency:  # pylint: disable=too-few-public-methods
+    """The one model a server keeps loaded, with its num_ctx and expiry."""
+
+    def __init__(self, load_seconds: float = 0.0):
+        self.load_seconds = load_seconds
+        self.state: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def load(self, body: Dict[str, Any]) -> float:
+        """Loads the model unless it is resident with the same num_ctx; returns load time."""
+        num_ctx = (body.get("options") or {}).get("num_ctx", 2048)
+        now = time.monotonic()
+        with self.lock:
+            seconds = 0.0
+            if self.state.get("num_ctx") != num_ctx or self.state.get("until", 0) < now:
+                seconds = self.load_seconds
+                time.sleep(seconds)
+            self.state.update(num_ctx=num_ctx, until=time.monotonic() + keep_alive_seconds(
+                body.get("keep_alive")))
+        return seconds
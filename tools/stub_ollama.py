@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stand-in Ollama Server (v0.2)
+
+Purpose:
+  Ollama's native API (/api/tags, /api/chat streaming NDJSON) for testing
+  the 'ollama' backend without a model. Like stub_server.py, plus model
+  residency: the first request, one after keep_alive expired and one with
+  another num_ctx pay --load-seconds (reported as load_duration; see
+  stub_model.ModelResidency).
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Model residency moved to stub_model.py
+"""
+# pylint: disable=useless-return,invalid-name
+
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer
+from typing import Any, Dict
+
+from stub_model import ModelResidency, StubSettings, prefill_seconds, prompt_chars, uncached_chars
+from stub_server import StubHandler
+
+
+class OllamaStubHandler(StubHandler):
+    """Serves /api/tags and /api/chat."""
+    residency = ModelResidency()
+
+    def do_GET(self) -> None:
+        """Lists the single synthetic model."""
+        body = json.dumps({"models": [{"name": "stub", "model": "stub", "size": 0}]})
+        self._send(200, body.encode(), {"Content-Type": "application/json"})
+        return None
+
+    def do_POST(self) -> None:
+        """Answers /api/chat, streaming (NDJSON) or not."""
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        limit = (body.get("options") or {}).get("num_predict") or self.settings.tokens
+        count = min(int(limit), self.settings.tokens)
+        if self.settings.capacity:
+            self.gate.acquire()  # pylint: disable=consider-using-with
+        try:
+            final = {
+                "model": body.get("model"), "done": True, "done_reason": "stop",
+                "load_duration": int(self.residency.load(body) * 1e9),
+                "prompt_eval_count": prompt_chars(body) // 4, "eval_count": count,
+            }
+            prefill = uncached_chars(body, self.kv_cache, self.settings.kv_cache)
+            time.sleep(prefill_seconds(prefill, self.settings))
+            if self.path != "/api/chat":
+                self._send(404, b'{"error": "not found"}', {"Content-Type": "application/json"})
+            elif body.get("stream", True):
+                self._stream_ndjson(final)
+            else:
+                time.sleep(self.settings.token_delay * final["eval_count"])
+                text = "".join(f"tok{i} " for i in range(final["eval_count"]))
+                final["message"] = {"role": "assistant", "content": text}
+                self._send(200, json.dumps(final).encode(), {"Content-Type": "application/json"})
+        finally:
+            if self.settings.capacity:
+                self.gate.release()
+        return None
+
+    def _stream_ndjson(self, final: Dict[str, Any]) -> None:
+        """One JSON object per line, ending with the counters (Ollama streams by default)."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for i in range(final["eval_count"]):
+            chunk = {"model": final["model"], "done": False,
+                     "message": {"role": "assistant", "content": f"tok{i} "}}
+            self.wfile.write(json.dumps(chunk).encode() + b"\n")
+            self.wfile.flush()
+            time.sleep(self.settings.token_delay)
+        final["message"] = {"role": "assistant", "content": ""}
+        self.wfile.write(json.dumps(final).encode() + b"\n")
+        self.wfile.flush()
+        self.close_connection = True
+        return None
+
+
+def build_ollama_server(
+    port: int, settings: StubSettings, load_seconds: float = 0.0
+) -> ThreadingHTTPServer:
+    """Creates (but does not start) an Ollama-format server."""
+    handler = type("ConfiguredOllamaHandler", (OllamaStubHandler,), {
+        "settings": settings, "residency": ModelResidency(load_seconds),
+        "gate": threading.BoundedSemaphore(max(settings.capacity, 1)), "kv_cache": [],
+    })
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Stand-in Ollama Server")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--tokens", type=int, default=64, help="Max completion tokens")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds per token")
+    parser.add_argument("--prefill-ms-per-kchar", type=float, default=0.0)
+    parser.add_argument("--load-seconds", type=float, default=0.0, help="Model load time")
+    parser.add_argument("--capacity", type=int, default=0, help="Concurrent requests")
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        tokens=args.tokens, token_delay=args.token_delay,
+        prefill_ms_per_kchar=args.prefill_ms_per_kchar, capacity=args.capacity
+    )
+    build_ollama_server(args.port, settings, args.load_seconds).serve_forever()
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stand-in OpenAI Reply Bodies (v0.1)
+
+Purpose:
+  Request admission and the OpenAI-format bodies of stub_server.py: prompt
+  processing time after the optional prefix cache, the context-window
+  error, non-streaming replies with one choice per `n`, and SSE chunks.
+
+History:
+  1. 2026-10-19 Initial version (split from stub_server.py)
+"""
+# pylint: disable=useless-return
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from stub_model import StubSettings, prefill_seconds, prompt_chars, uncached_chars, usage_block
+
+
+def admit(
+    body: Dict[str, Any], kv_cache: List[str], settings: StubSettings
+) -> Tuple[float, Optional[Dict[str, Any]]]:
+    """(prefill seconds, error body or None); the prefix cache is updated either way."""
+    prefill = uncached_chars(body, kv_cache, settings.kv_cache)
+    error = None
+    if 0 < settings.context_chars < prompt_chars(body):
+        error = {"error": {"message": "the request exceeds the available context size"}}
+    return prefill_seconds(prefill, settings), error
+
+
+def completion_reply(body: Dict[str, Any], count: int) -> Dict[str, Any]:
+    """Non-streaming reply; `n` identical choices, usage counting all of them."""
+    text = "".join(f"tok{i} " for i in range(count))
+    choices = int(body.get("n") or 1)
+    return {
+        "object": "chat.completion", "model": body.get("model"),
+        "choices": [{"index": i, "message": {"role": "assistant", "content": text},
+                     "finish_reason": "stop"} for i in range(choices)],
+        "usage": usage_block(body, count * choices),
+    }
+
+
+def sse_line(chunk: Dict[str, Any]) -> bytes:
+    """One Server-Sent Events data line."""
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+def token_chunk(index: int) -> Dict[str, Any]:
+    """Streamed delta carrying token `index`."""
+    return {"object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": {"content": f"tok{index} "}}]}
+
+
+def usage_chunk(body: Dict[str, Any], count: int) -> Dict[str, Any]:
+    """Final usage chunk (stream_options.include_usage)."""
+    return {"object": "chat.completion.chunk", "choices": [], "usage": usage_block(body, count)}
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stand-in LLM Server (v0.2)
+
+Purpose:
+  A local OpenAI-compatible server for benchmarks and manual testing without
+  a model. Replies are synthetic tokens; prompt processing time, per-token
+  time and concurrent capacity are configurable.
+
+History:
+  1. 2026-10-19 Initial version
+  2. 2026-10-19 Optional prefix cache (--kv-cache); model behaviour in stub_model.py
+  3. 2026-10-19 Quadratic prefill term and context window (HTTP 400 beyond it)
+  4. 2026-10-19 Honours n (no streaming)
+  5. 2026-10-19 Admission and reply bodies moved to stub_replies.py
+"""
+# pylint: disable=useless-return,invalid-name
+
+import json
+import gzip
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List
+
+from stub_model import StubSettings
+from stub_replies import admit, completion_reply, sse_line, token_chunk, usage_chunk
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /v1/models and /v1/chat/completions."""
+    protocol_version = "HTTP/1.1"
+    settings = StubSettings()
+    gate = threading.BoundedSemaphore(1)
+    kv_cache: List[str] = []
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        return None
+
+    def _send(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return None
+
+    def do_GET(self) -> None:
+        """Lists the single synthetic model."""
+        body = json.dumps({"object": "list", "data": [{"id": "stub", "object": "model"}]})
+        self._send(200, body.encode(), {"Content-Type": "application/json"})
+        return None
+
+    def do_POST(self) -> None:
+        """Answers a chat completion, streaming or not."""
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        count = min(int(body.get("max_tokens") or self.settings.tokens), self.settings.tokens)
+        if self.settings.capacity:
+            self.gate.acquire()  # pylint: disable=consider-using-with
+        try:
+            prefill, error = admit(body, self.kv_cache, self.settings)
+            if error:
+                self._send(400, json.dumps(error).encode(), {"Content-Type": "application/json"})
+            else:
+                time.sleep(prefill)
+                (self._stream if body.get("stream") else self._complete)(body, count)
+        finally:
+            if self.settings.capacity:
+                self.gate.release()
+        return None
+
+    def _complete(self, body: Dict[str, Any], count: int) -> None:
+        time.sleep(self.settings.token_delay * count)
+        data = json.dumps(completion_reply(body, count)).encode()
+        headers = {"Content-Type": "application/json"}
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        self._send(200, data, headers)
+        return None
+
+    def _stream(self, body: Dict[str, Any], count: int) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for i in range(count):
+            self.wfile.write(sse_line(token_chunk(i)))
+            self.wfile.flush()
+            time.sleep(self.settings.token_delay)
+        if (body.get("stream_options") or {}).get("include_usage"):
+            self.wfile.write(sse_line(usage_chunk(body, count)))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+        return None
+
+
+def build_server(port: int, settings: StubSettings) -> ThreadingHTTPServer:
+    """Creates (but does not start) a server with the given behaviour."""
+    handler = type("ConfiguredStubHandler", (StubHandler,), {
+        "settings": settings,
+        "gate": threading.BoundedSemaphore(max(settings.capacity, 1)),
+        "kv_cache": [],
+    })
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Stand-in LLM Server")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--tokens", type=int, default=64, help="Completion tokens per reply")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds per token")
+    parser.add_argument("--prefill-ms-per-kchar", type=float, default=0.0)
+    parser.add_argument("--capacity", type=int, default=0, help="Concurrent requests")
+    parser.add_argument("--kv-cache", action="store_true", help="Reuse the last prompt prefix")
+    parser.add_argument("--prefill-ms-per-kchar2", type=float, default=0.0)
+    parser.add_argument("--context-chars", type=int, default=0, help="Reject longer prompts")
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        args.tokens, args.token_delay, args.prefill_ms_per_kchar, args.capacity, args.kv_cache,
+        args.prefill_ms_per_kchar2, args.context_chars
+    )
+    build_server(args.port, settings).serve_forever()
+    return None
+
+
+if __name__ == "__main__":
+    main()